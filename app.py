@@ -1,16 +1,32 @@
 import os
+import asyncio
+import functools
 import logging
 import re
-import math
 import secrets
 import json
-from datetime import datetime, timedelta
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from dotenv import load_dotenv
 
+import aiohttp
+import orjson
+
 from flask import Flask, request
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event as sa_event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import contains_eager
 from slack_bolt import App
 from slack_bolt.adapter.flask import SlackRequestHandler
+from slack_sdk.errors import SlackApiError
+import slack_sdk.web.base_client
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
 # -------------------------
 # 1. Configuration & Setup
@@ -27,35 +43,97 @@ ROOT_ADMIN_ID = os.getenv("ROOT_ADMIN_ID")  # Your User ID (Fail-safe admin)
 CRON_SECRET = os.getenv("CRON_SECRET")      # Password for GitHub Actions
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///reminder_app.db")
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (used for the route responses, e.g. /keep-alive and the cron)."""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Initialize Flask
 flask_app = Flask(__name__)
+flask_app.json = OrjsonProvider(flask_app)
 
 # Database Configuration
 # pool_pre_ping prevents "SSL SYSCALL error: EOF detected" on Render/Supabase
 flask_app.config['SQLALCHEMY_DATABASE_URI'] = DATABASE_URL
 flask_app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# pool_size keeps warm connections per worker so requests skip the TCP/TLS/auth handshake.
+# Capped at 3 + 2 overflow per worker so 2 gunicorn workers stay under Supabase's 15 client connections
+# (point DATABASE_URL at the Supavisor pooler, port 6543, when running more workers).
+# pool_use_lifo hands out the most recently returned connection, so idle extras age out via pool_recycle
+# query_cache_size holds compiled SQL for reuse across requests
 flask_app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
     "pool_pre_ping": True,
     "pool_recycle": 300,
+    "pool_size": 3,
+    "max_overflow": 2,
+    "pool_timeout": 30,
+    "pool_use_lifo": True,
+    "query_cache_size": 1200,
 }
+if DATABASE_URL.startswith("postgres"):
+    # Fail slow queries fast instead of holding a pooled connection
+    flask_app.config['SQLALCHEMY_ENGINE_OPTIONS']["connect_args"] = {"options": "-c statement_timeout=5000"}
 
 db = SQLAlchemy(flask_app)
 
+class AppContextExecutor(ThreadPoolExecutor):
+    """
+    Bolt runs listeners (and lazy listeners) on its listener executor, outside the Flask request thread.
+    Pushing the app context here gives every handler DB access without its own `with flask_app.app_context()`.
+    """
+    def submit(self, fn, /, *args, **kwargs):
+        def run():
+            with flask_app.app_context():
+                return fn(*args, **kwargs)
+        return super().submit(run)
+
 # Initialize Bolt
-bolt_app = App(token=SLACK_BOT_TOKEN, signing_secret=SLACK_SIGNING_SECRET)
+bolt_app = App(
+    token=SLACK_BOT_TOKEN,
+    signing_secret=SLACK_SIGNING_SECRET,
+    listener_executor=AppContextExecutor(max_workers=10),
+)
+# Wait out a 429's Retry-After and retry once; Bolt copies these handlers into every listener's client
+bolt_app.client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=1))
 handler = SlackRequestHandler(bolt_app)
 
+# slack_sdk encodes every Web API JSON body (views_publish, chat_postMessage, ...) with
+# its module-level `json`; route that through orjson. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so the SDK's error handling keeps working.
+slack_sdk.web.base_client.json = types.SimpleNamespace(
+    dumps=lambda obj, **kwargs: orjson.dumps(obj).decode(),
+    loads=orjson.loads,
+    decoder=json.decoder,
+)
+
 # Logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Max in-flight Slack requests during a DM fan-out
+NOTIFY_CONCURRENCY = 16
+# Failed channel IDs named per error kind in the fan-out warning
+FAILED_CHANNELS_LOGGED = 20
+
+# Statements slower than this are logged so regressions show up in the Render logs
+SLOW_QUERY_MS = int(os.getenv("SLOW_QUERY_MS", "100"))
+
+@sa_event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    context._query_start = time.perf_counter()
+
+@sa_event.listens_for(Engine, "after_cursor_execute")
+def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - context._query_start) * 1000
+    if elapsed_ms >= SLOW_QUERY_MS:
+        logger.warning("Slow query (%.0f ms): %s", elapsed_ms, statement)
+
 # -------------------------
 # 2. Database Models
 # -----------p--------------
-class EventTye(db.Model):
-    """Dynamic list of event categories (SAT, AP, Soccer, etc.)"""
-    name = db.Column(db.String(50), primary_key=True)
-
 class AppAdmin(db.Model):
     __tablename__ = 'app_admin'
     """List of additional admin user IDs"""
@@ -67,17 +145,42 @@ class Event(db.Model):
     event_type = db.Column(db.String(50), db.ForeignKey('event_type.name'), nullable=False)
     event_date = db.Column(db.Date, nullable=False)
     registration_deadline = db.Column(db.Date, nullable=False)
+    __table_args__ = (
+        # Backs the per-category listing (filter on type, ordered by date)
+        db.Index('ix_event_type_date', 'event_type', 'event_date'),
+        # Category page count: equality on type, range on deadline
+        db.Index('ix_event_type_deadline', 'event_type', 'registration_deadline'),
+        # Cron reminders / briefing look events up by exact or ranged dates.
+        # On PostgreSQL ix_event_deadline_title leads with the deadline and covers these lookups too
+        db.Index('ix_event_deadline', 'registration_deadline').ddl_if(
+            callable_=lambda *args, dialect, **kw: dialect.name != 'postgresql'),
+        db.Index('ix_event_date', 'event_date'),
+        # Typeahead searches walk open events by deadline and test the title in the index itself (no heap visits)
+        db.Index('ix_event_deadline_title', 'registration_deadline', 'title',
+                 postgresql_include=['id', 'event_type', 'event_date']).ddl_if(dialect='postgresql'),
+        # Substring (ILIKE '%q%') title search from the typeahead menus; needs pg_trgm, created in init_db()
+        db.Index('ix_event_title_trgm', 'title', postgresql_using='gin',
+                 postgresql_ops={'title': 'gin_trgm_ops'}).ddl_if(dialect='postgresql'),
+    )
 
 class EventType(db.Model):
+    """Dynamic list of event categories (SAT, AP, Soccer, etc.)"""
     __tablename__ = 'event_type'
-    name = db.Column(db.String(50), primary_key='True')
+    name = db.Column(db.String(50), primary_key=True)
 
 class Subscription(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     channel_id = db.Column(db.String(50), nullable=False)
-    event_id = db.Column(db.Integer, db.ForeignKey('event.id'), nullable=False)
+    event_id = db.Column(db.Integer, db.ForeignKey('event.id', ondelete='CASCADE'), nullable=False)
     status = db.Column(db.String(20), nullable=True)
-    __table_args__ = (db.UniqueConstraint('channel_id', 'event_id', name='_user_event_uc'),)
+    event = db.relationship('Event')
+    __table_args__ = (
+        db.UniqueConstraint('channel_id', 'event_id', name='_user_event_uc'),
+        # The unique constraint leads with channel_id; per-event fan-out needs event_id first
+        db.Index('ix_sub_event_channel', 'event_id', 'channel_id'),
+        # /check-pending and /nudge-pending filter on (event_id, status)
+        db.Index('ix_sub_event_status', 'event_id', 'status'),
+    )
 
 class AppConfig(db.Model):
     """Stores global settings like the Consultant Channel ID"""
@@ -98,56 +201,157 @@ class TrackedStudent(db.Model):
     # Prevent duplicate tracking entries
     __table_args__ = (db.UniqueConstraint('consultant_id', 'channel_id', name='_consultant_student_uc'),)
 
+def insert_ignore(model, rows):
+    """
+    Single-statement INSERT ... ON CONFLICT DO NOTHING for one dict or a list of dicts.
+    Duplicates (PK / unique constraint) are skipped atomically. Caller commits.
+    """
+    dialect = postgresql if db.engine.dialect.name == "postgresql" else sqlite
+    return db.session.execute(dialect.insert(model).values(rows).on_conflict_do_nothing())
+
 # Initialize DB and Seed Data
-with flask_app.app_context():
-    db.create_all()
-    # Seed default types if empty
-    if not EventType.query.first():
-        defaults = ["SAT", "ACT", "AP", "Extracurricular"]
-        for d in defaults:
-            db.session.add(EventType(name=d))
-        db.session.commit()
+# Arbitrary pg_advisory_xact_lock key; serializes init_db() across gunicorn workers booting at once
+INIT_DB_LOCK_KEY = 80317
+
+def init_db():
+    """Creates missing tables and indexes and seeds the default event types."""
+    # All schema DDL runs in one transaction. On PostgreSQL a second worker waits on the lock and then
+    # finds everything in place, instead of failing its boot on a duplicate CREATE INDEX.
+    with db.engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            # The pool's 5s statement_timeout would cancel the lock wait or a long index build and fail the boot
+            conn.execute(db.text("SET LOCAL statement_timeout = 0"))
+            conn.execute(db.text("SELECT pg_advisory_xact_lock(:key)"), {"key": INIT_DB_LOCK_KEY})
+            # Trigram opclass for ix_event_title_trgm; probed first so warm boots issue no DDL
+            if not conn.scalar(db.text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")):
+                conn.execute(db.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            # Superseded by ix_event_deadline_title; older deploys still carry it
+            if conn.scalar(db.text("SELECT to_regclass('ix_event_deadline')")):
+                conn.execute(db.text("DROP INDEX ix_event_deadline"))
+        db.metadata.create_all(conn)
+        # create_all() only builds indexes together with a new table; add any declared later to existing tables
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+    # Seed default types; existing rows are skipped, so no probe query is needed
+    defaults = ["SAT", "ACT", "AP", "Extracurricular"]
+    insert_ignore(EventType, [{"name": d} for d in defaults])
+    db.session.commit()
+
+@flask_app.cli.command("init-db")
+def init_db_command():
+    """flask --app app init-db"""
+    init_db()
+
+# Set INIT_DB=0 once the schema exists to skip this on every worker boot
+if os.getenv("INIT_DB", "1") == "1":
+    with flask_app.app_context():
+        init_db()
 
 # -------------------------
 # 3. Helper Functions (Logic & UI)
 # -------------------------
+# Event types, admins, the consultant channel and the rendered dashboard change rarely, so keep them in-process for a short TTL.
+# Entries are (timestamp, value); reset to (0, None) to force a reload.
+# The TTL also bounds staleness in other gunicorn workers, which never see this process's invalidations.
+_TTL = 60
+_cache = {"types": (0, None), "admins": (0, None)}
+
+def _cached(key, loader):
+    ts, value = _cache.get(key, (0, None))
+    if value is None or time.time() - ts >= _TTL:
+        value = loader()
+        _cache[key] = (time.time(), value)
+    return value
+
+def invalidate_cache(key):
+    _cache[key] = (0, None)
+
+def invalidate_dashboard():
+    """Call after any Event/EventType write; drops every cached dashboard and category page."""
+    for key in list(_cache):
+        if isinstance(key, tuple) and key[0] in ("dashboard", "category"):
+            _cache.pop(key, None)
+
+def get_event_types():
+    """Returns the list of category names (cached)."""
+    return _cached("types", lambda: db.session.scalars(db.select(EventType.name)).all())
+
+def get_admin_ids():
+    """Returns the set of admin user IDs stored in the DB (cached)."""
+    return _cached("admins", lambda: set(db.session.scalars(db.select(AppAdmin.user_slack_id))))
+
+def get_consultant_channel():
+    """Returns the consultant feed channel ID from AppConfig, or None if unset (cached)."""
+    # Cached as "" when unset so a missing row is not re-queried on every call
+    return _cached("consultant_channel", lambda: getattr(db.session.get(AppConfig, "consultant_channel"), "value", "")) or None
+
 def is_user_admin(user_id):
     """Checks env var AND database for admin status."""
     if user_id == ROOT_ADMIN_ID:
         return True
-    return db.session.query(AppAdmin).filter_by(user_slack_id=user_id).first() is not None
+    return user_id in get_admin_ids()
 
-def get_sorted_events(channel_id, category=None):
-    """Fetches events with subscription status via JOIN, sorted by subscription and date."""
+def get_sorted_events(channel_id, category=None, limit=None, offset=0, per_category=None):
+    """
+    Fetches events with subscription status via JOIN, sorted by subscription and date.
+    limit/offset page in SQL so callers never load rows they won't render.
+    per_category keeps only the first N rows of each event_type (ROW_NUMBER window);
+    those rows also carry .cat_total, the type's full count.
+    Returns lightweight Rows (only the rendered columns) instead of ORM objects;
+    each row also serves as the subscription entry, exposing .status.
+    """
     
-    today = datetime.now().date()
+    today = date.today()
+    event_cols = (Event.id, Event.title, Event.event_type, Event.event_date, Event.registration_deadline)
     
-    # LEFT JOIN to get subscription status for this user
-    query = db.session.query(
-        Event,
-        Subscription
-    ).outerjoin(
-        Subscription,
-        (Event.id == Subscription.event_id) & (Subscription.channel_id == channel_id)
-    ).filter(Event.registration_deadline >= today)
+    if channel_id:
+        # LEFT JOIN to get subscription status for this user
+        query = db.session.query(
+            *event_cols,
+            Subscription.id.label("sub_id"),
+            Subscription.status
+        ).outerjoin(
+            Subscription,
+            (Event.id == Subscription.event_id) & (Subscription.channel_id == channel_id)
+        )
+        # Sort: subscribed first, then by date
+        order = [Subscription.id.is_(None)]  # False (subscribed) comes first
+    else:
+        # No channel can match '' - skip the join, rows keep the same shape
+        query = db.session.query(*event_cols, db.null().label("sub_id"), db.null().label("status"))
+        order = []
+    query = query.filter(Event.registration_deadline >= today)
     
     if category:
         query = query.filter(Event.event_type == category)
     
-    # Sort: subscribed first, then by date
-    query = query.order_by(
-        (Subscription.id.is_(None)),  # False (subscribed) comes first
-        Event.event_date
-    )
+    # id breaks ties so pages stay stable between queries
+    sort = [*order, Event.event_date, Event.id]
+    if per_category is not None:
+        ranked = query.add_columns(
+            db.func.row_number().over(partition_by=Event.event_type, order_by=sort).label("rn"),
+            db.func.count().over(partition_by=Event.event_type).label("cat_total")
+        ).subquery()
+        query = db.session.query(ranked).filter(ranked.c.rn <= per_category).order_by(ranked.c.event_type, ranked.c.rn)
+    else:
+        query = query.order_by(*sort)
+    if limit is not None:
+        query = query.limit(limit).offset(offset)
     
-    results = query.all()
+    events = query.all()
     
-    # Extract events and build subscription set
-    events = [row[0] for row in results]
-    subs = {row[0].id: row[1] for row in results if row[1]}
+    # Build subscription lookup
+    subs = {row.id: row for row in events if row.sub_id is not None}
     
     return events, subs
 
+# Max candidates listed when a search is ambiguous
+FIND_EVENT_LIMIT = 10
+
+# Typeahead menus ask Slack for at least this many characters; shorter queries would match nearly every event
+MIN_SEARCH_LEN = 2
+
 def find_event_by_query(query_text):
     """
     Tries to find a single event based on ID (int) or Title (string).
@@ -156,71 +360,180 @@ def find_event_by_query(query_text):
     if not query_text:
         return None, "⚠️ 검색어를 입력해주세요. (예: `/check-pending SAT`)"
     
-    # 1. Try search by ID
+    # Search by ID and by Title (partial, case-insensitive) in one round-trip.
+    # An exact ID match sorts first and wins outright, as before.
+    query = Event.query
     if query_text.isdigit():
-        event = Event.query.get(int(query_text))
-        if event: return event, None
+        event_id = int(query_text)
+        query = query.filter(db.or_(Event.id == event_id, Event.title.ilike(f"%{query_text}%")))
+        query = query.order_by(Event.id != event_id, Event.event_date)
+    else:
+        query = query.filter(Event.title.ilike(f"%{query_text}%")).order_by(Event.event_date)
+    # One extra row tells us whether matches were left out of the list
+    events = query.limit(FIND_EVENT_LIMIT + 1).all()
     
-    # 2. Try search by Title (Partial Match)
-    # ilike makes it case-insensitive
-    events = Event.query.filter(Event.title.ilike(f"%{query_text}%")).all()
+    if events and query_text.isdigit() and events[0].id == int(query_text):
+        return events[0], None
     
     if len(events) == 0:
         return None, f"⚠️ '{query_text}'에 해당하는 이벤트를 찾을 수 없습니다."
     elif len(events) > 1:
         # If multiple matches, ask for ID
-        msg = "⚠️ 여러 이벤트가 검색되었습니다. 정확한 ID를 입력해주세요:\n"
-        for e in events:
-            msg += f"• [ID: {e.id}] {e.title} ({e.event_date})\n"
+        msg = "⚠️ 여러 이벤트가 검색되었습니다. 정확한 ID를 입력해주세요:\n" + "".join(
+            f"• [ID: {e.id}] {e.title} ({e.event_date})\n" for e in events[:FIND_EVENT_LIMIT]
+        )
+        if len(events) > FIND_EVENT_LIMIT:
+            msg += "… 외에도 검색 결과가 더 있습니다. 검색어를 더 구체적으로 입력해주세요.\n"
         return None, msg
         
     return events[0], None
 
+async def _post_messages_async(token, base_url, messages):
+    semaphore = asyncio.Semaphore(NOTIFY_CONCURRENCY)
+    # One shared session keeps connections alive across the batch; aiohttp encodes bodies with orjson too
+    async with aiohttp.ClientSession(json_serialize=lambda obj: orjson.dumps(obj).decode()) as session:
+        client = AsyncWebClient(token=token, base_url=base_url, session=session)
+
+        async def send(kwargs):
+            async with semaphore:
+                try:
+                    try:
+                        await client.chat_postMessage(**kwargs)
+                    except SlackApiError as e:
+                        # Wait out one rate-limit response, then retry once
+                        if e.response.get("error") != "ratelimited":
+                            raise
+                        await asyncio.sleep(int(e.response.headers.get("Retry-After", 1)))
+                        await client.chat_postMessage(**kwargs)
+                    return None
+                except Exception as e:
+                    logger.debug("Fail DM %s: %s", kwargs.get('channel'), e)
+                    # Slack's error code (channel_not_found, is_archived, ...) says more than the exception type
+                    if isinstance(e, SlackApiError):
+                        return e.response.get("error") or type(e).__name__
+                    return type(e).__name__
+
+        errors = await asyncio.gather(*(send(m) for m in messages))
+
+    # One warning per error kind instead of one line per DM (a Slack outage would fail every send)
+    failed = {}
+    for message, err in zip(messages, errors):
+        if err is not None:
+            failed.setdefault(err, []).append(message.get("channel"))
+    for err, channels in failed.items():
+        shown = ", ".join(channels[:FAILED_CHANNELS_LOGGED])
+        more = f" (+{len(channels) - FAILED_CHANNELS_LOGGED} more)" if len(channels) > FAILED_CHANNELS_LOGGED else ""
+        logger.warning("Failed to send %d of %d DMs: %s: %s%s", len(channels), len(messages), err, shown, more)
+    return len(messages) - sum(len(channels) for channels in failed.values())
+
+def post_messages(client, messages):
+    """
+    Sends a list of chat_postMessage kwargs concurrently on one event loop.
+    Uses client's token/base_url. Returns how many were delivered.
+    """
+    if not messages:
+        return 0
+    return asyncio.run(_post_messages_async(client.token, client.base_url, messages))
+
+_USER_MENTION_RE = re.compile(r"<@(U[A-Z0-9]+)(?:\|[^>]*)?>")
+_CHANNEL_MENTION_RE = re.compile(r"<#(C[A-Z0-9]+)(?:\|[^>]*)?>")
+
 def parse_user_id(text):
     """Extracts U12345 from text like '<@U12345|name>'"""
-    match = re.search(r"<@(U[A-Z0-9]+)(\|.*?)?>", text)
+    match = _USER_MENTION_RE.search(text)
     return match.group(1) if match else None
 
 def parse_channel_id(text):
     """Extracts U12345 from text like '<#C12345|general>'"""
-    match = re.search(r"<#(C[A-Z0-9]+)(\|.*?)?>", text)
+    match = _CHANNEL_MENTION_RE.search(text)
     return match.group(1) if match else None
 
 
+# Static Block Kit pieces shared by every event block.
+# Built once at import; blocks are never mutated after being built, so they are shared, not copied.
+_EDIT_OPTION_TEXT = {"type": "plain_text", "text": "✏️ Edit"}
+_DELETE_OPTION_TEXT = {"type": "plain_text", "text": "🗑️ Delete"}
+# Templates for the per-event dicts: dict.copy() plus one assignment beats rebuilding the literal
+_OVERFLOW_TMPL = {"type": "overflow", "action_id": "event_actions", "options": None}
+_CONFIRM_BUTTON_TMPL = {
+    "type": "button",
+    "text": {"type": "plain_text", "text": "등록 확인"},
+    "value": None,
+    "action_id": "confirm_registration",
+    "style": "primary"
+}
+_REGISTERED_BLOCK = {
+    "type": "context",
+    "elements": [
+        {"type": "mrkdwn", "text": "등록 완료"}
+    ]
+}
+
+_DIVIDER = {"type": "divider"}
+
+# Fixed top of the Home Tab dashboard
+_DASHBOARD_INTRO_BLOCKS = (
+    {"type": "header", "text": {"type": "plain_text", "text": "📅 시험/EC 날짜 확인"}},
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": (
+                "👋 이 앱은 시험(SAT, AP 등) 및 교내외 활동 일정을 관리해줍니다.\n\n"
+                "📌 *사용 방법:*\n"
+                "• 관심 있는 이벤트의 *'알림 구독'* 버튼을 눌러주세요.\n"
+                "• 구독하시면 *마감일 및 행사 당일 3일 전부터* 매일 아침 DM으로 알림을 보내드립니다.\n"
+                "• 놓치기 쉬운 등록 마감일(Deadline)과 시험 당일을 잊지 마세요!"
+            )
+        }
+    },
+    _DIVIDER
+)
+
+_ADMIN_CONTROLS_BLOCKS = (
+    {"type": "section", "text": {"type": "mrkdwn", "text": "⚙️ *Admin Controls*"}},
+    {
+        "type": "actions",
+        "elements": [
+            {"type": "button", "text": {"type": "plain_text", "text": "+ Event"}, "action_id": "open_add_event_modal", "style": "primary"},
+            {"type": "button", "text": {"type": "plain_text", "text": "+ Category"}, "action_id": "open_add_type_modal"},
+            {"type": "button", "text": {"type": "plain_text", "text": "Subscribe Channel"}, "action_id": "open_admin_sub_modal"},
+            {"type": "button", "text": {"type": "plain_text", "text": "Register Channel"}, "action_id": "open_admin_register_modal"},
+            {"type": "button", "text": {"type": "plain_text", "text": "Manage Admins"}, "action_id": "open_manage_admins_modal"}
+        ]
+    },
+    _DIVIDER
+)
+
+_HOME_NAV_BLOCK = {"type": "actions", "elements": [{"type": "button", "text": {"type": "plain_text", "text": "« 홈페이지로"}, "action_id": "nav_home"}]}
+
 def build_event_block(event, subscription, is_admin=False):
     """
     Creates event blocks. 
     Returns a LIST of blocks to accommodate the status button.
     """
-    date_str = event.event_date.strftime('%Y-%m-%d')
-    deadline_str = event.registration_deadline.strftime('%Y-%m-%d')
+    date_str = event.event_date.isoformat()
+    deadline_str = event.registration_deadline.isoformat()
     is_subscribed = subscription is not None
     status = subscription.status if is_subscribed else None
-    # Common Text
-    text_section = {
-        "type": "mrkdwn", 
-        "text": f"*{event.title}*\n📅 {date_str} | ⏰ 데드라인: {deadline_str}"
-    }
-
-    # --- ADMIN VIEW (Overflow Menu) ---
-    if is_admin:
-        
-        accessory = {
-            "type": "overflow",
-            "action_id": "event_actions",
-            "options": [
-                {"text": {"type": "plain_text", "text": "✏️ Edit"}, "value": f"edit|{event.id}"},
-                {"text": {"type": "plain_text", "text": "🗑️ Delete"}, "value": f"delete|{event.id}"}
-            ]
-        }
 
     # 1. Create the Main Block
     main_block = {
         "type": "section",
-        "text": text_section
+        "text": {
+            "type": "mrkdwn", 
+            "text": f"*{event.title}*\n📅 {date_str} | ⏰ 데드라인: {deadline_str}"
+        }
     }
+
+    # --- ADMIN VIEW (Overflow Menu) ---
     if is_admin:
-        main_block['accessory'] = accessory # type: ignore
+        accessory = _OVERFLOW_TMPL.copy()
+        accessory["options"] = [
+            {"text": _EDIT_OPTION_TEXT, "value": f"edit|{event.id}"},
+            {"text": _DELETE_OPTION_TEXT, "value": f"delete|{event.id}"}
+        ]
+        main_block["accessory"] = accessory
     
     blocks = [main_block]
 
@@ -228,66 +541,31 @@ def build_event_block(event, subscription, is_admin=False):
     if is_subscribed:
         if status == "Pending":
             # Show "I Registered" Button
-            blocks.append({
-                "type": "actions",
-                "elements": [
-                    {
-                        "type": "button",
-                        "text": {"type": "plain_text", "text": "등록 확인"},
-                        "value": str(event.id),
-                        "action_id": "confirm_registration",
-                        "style": "primary"
-                    }
-                ]
-            })
+            button = _CONFIRM_BUTTON_TMPL.copy()
+            button["value"] = str(event.id)
+            blocks.append({"type": "actions", "elements": [button]})
         elif status == "Registered":
             # Show "Registered" Text
-            blocks.append({
-                "type": "context",
-                "elements": [
-                    {"type": "mrkdwn", "text": "등록 완료"}
-                ]
-            })
+            blocks.append(_REGISTERED_BLOCK)
 
     return blocks
 
 def get_dashboard_view(user_id):
-    """Constructs the Home Tab Dashboard."""
+    """
+    Constructs the Home Tab Dashboard.
+    The blocks only depend on admin status and event data, so they are cached per admin bit.
+    """
     is_admin = is_user_admin(user_id)
-    event_types = [et.name for et in EventType.query.all()]
+    return _cached(("dashboard", is_admin), lambda: _build_dashboard_view(is_admin))
+
+def _build_dashboard_view(is_admin):
+    event_types = get_event_types()
     
-    blocks = [
-        {"type": "header", "text": {"type": "plain_text", "text": "📅 시험/EC 날짜 확인"}},
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": (
-                    "👋 이 앱은 시험(SAT, AP 등) 및 교내외 활동 일정을 관리해줍니다.\n\n"
-                    "📌 *사용 방법:*\n"
-                    "• 관심 있는 이벤트의 *'알림 구독'* 버튼을 눌러주세요.\n"
-                    "• 구독하시면 *마감일 및 행사 당일 3일 전부터* 매일 아침 DM으로 알림을 보내드립니다.\n"
-                    "• 놓치기 쉬운 등록 마감일(Deadline)과 시험 당일을 잊지 마세요!"
-                )
-            }
-        },
-        {"type": "divider"}
-    ]
+    blocks = list(_DASHBOARD_INTRO_BLOCKS)
     
     # Admin Controls
     if is_admin:
-        blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": "⚙️ *Admin Controls*"}})
-        blocks.append({
-            "type": "actions",
-            "elements": [
-                {"type": "button", "text": {"type": "plain_text", "text": "+ Event"}, "action_id": "open_add_event_modal", "style": "primary"},
-                {"type": "button", "text": {"type": "plain_text", "text": "+ Category"}, "action_id": "open_add_type_modal"},
-                {"type": "button", "text": {"type": "plain_text", "text": "Subscribe Channel"}, "action_id": "open_admin_sub_modal"},
-                {"type": "button", "text": {"type": "plain_text", "text": "Register Channel"}, "action_id": "open_admin_register_modal"},
-                {"type": "button", "text": {"type": "plain_text", "text": "Manage Admins"}, "action_id": "open_manage_admins_modal"}
-            ]
-        })
-        blocks.append({"type": "divider"})
+        blocks.extend(_ADMIN_CONTROLS_BLOCKS)
 
     # Content Calculation (Max 100 blocks)
     remaining_blocks = 100 - len(blocks)
@@ -296,20 +574,26 @@ def get_dashboard_view(user_id):
         blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": "No categories defined."}})
         return blocks
 
-    items_per_cat = min(math.floor((remaining_blocks - (num_cats * 2)) / num_cats), 10)
-    items_per_cat = max(items_per_cat, 0) # Safety
+    items_per_cat = max(0, min(10, (remaining_blocks - num_cats * 2) // num_cats))
+
+    # One query for every category, capped per type in SQL, then bucket by type (keeps the SQL sort order)
+    # The extra row per type tells us whether "View All" is needed
+    all_events, subs = get_sorted_events('', per_category=items_per_cat + 1)
+    events_by_cat = {}
+    for event in all_events:
+        events_by_cat.setdefault(event.event_type, []).append(event)
 
     for cat in event_types:
         blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": f"📂 *{cat}*"}})
         
-        events, subs = get_sorted_events('', category=cat)
+        events = events_by_cat.get(cat, [])
         display_events = events[:items_per_cat]
         
         if not display_events:
             blocks.append({"type": "context", "elements": [{"type": "mrkdwn", "text": "이벤트 없음"}]})
         else:
             for event in display_events:
-                blocks.extend(build_event_block(event, subs[event.id] if event.id in subs.keys() else None, is_admin))
+                blocks.extend(build_event_block(event, subs.get(event.id), is_admin))
         
         # "View All" Button
         if len(events) > len(display_events):
@@ -317,7 +601,7 @@ def get_dashboard_view(user_id):
                 "type": "actions",
                 "elements": [{
                     "type": "button",
-                    "text": {"type": "plain_text", "text": f"모든 {cat} 보기 ({len(events)})"},
+                    "text": {"type": "plain_text", "text": f"모든 {cat} 보기 ({events[0].cat_total})"},
                     "value": cat,
                     "action_id": "nav_view_category" 
                 }]
@@ -328,23 +612,28 @@ def get_dashboard_view(user_id):
 def get_category_view(user_id, category, page=0):
     """Detailed view of a single category with pagination."""
     is_admin = is_user_admin(user_id)
+    # Like the dashboard, a page is the same for every admin / every non-admin
+    return _cached(("category", is_admin, category, page), lambda: _build_category_view(category, page, is_admin))
+
+def _build_category_view(category, page, is_admin):
     ITEMS_PER_PAGE = 20
-    events, subs = get_sorted_events('', category=category)
+    total = Event.query.filter(
+        Event.event_type == category,
+        Event.registration_deadline >= date.today()
+    ).count()
+    current_slice, subs = get_sorted_events('', category=category, limit=ITEMS_PER_PAGE, offset=page * ITEMS_PER_PAGE)
     
-    total_pages = math.ceil(len(events) / ITEMS_PER_PAGE)
-    start = page * ITEMS_PER_PAGE
-    end = start + ITEMS_PER_PAGE
-    current_slice = events[start:end]
+    total_pages = -(-total // ITEMS_PER_PAGE)
     
     blocks = [
         {"type": "header", "text": {"type": "plain_text", "text": f"📂 {category} Events"}},
-        {"type": "actions", "elements": [{"type": "button", "text": {"type": "plain_text", "text": "« 홈페이지로"}, "action_id": "nav_home"}]},
-        {"type": "divider"}
+        _HOME_NAV_BLOCK,
+        _DIVIDER
     ]
     
     for event in current_slice:
-        blocks.extend(build_event_block(event, subs[event.id] if event.id in subs.keys() else None, is_admin))
-        blocks.append({"type": "divider"})
+        blocks.extend(build_event_block(event, subs.get(event.id), is_admin))
+        blocks.append(_DIVIDER)
     
     # Pagination
     pagination_elements = []
@@ -364,44 +653,52 @@ def get_category_view(user_id, category, page=0):
         
     return blocks
 
+def render_home_context(user_id, context):
+    """
+    Rebuilds whichever home view the user is currently on.
+    context is the view's private_metadata: 'cat|<category>|<page>' or anything else for the dashboard.
+    """
+    if context and context.startswith("cat|"):
+        cat, page = context[len("cat|"):].rsplit("|", 1)
+        return get_category_view(user_id, cat, int(page))
+    return get_dashboard_view(user_id)
+
 def open_edit_event_modal(client, trigger_id, event_id):
     """Opens a modal pre-filled with existing event data."""
-    with flask_app.app_context():
-        event = Event.query.get(event_id)
-        if not event: return
-
-        types = EventType.query.all()
-        options = [{"text": {"type": "plain_text", "text": t.name}, "value": t.name} for t in types]
-        initial_option = next((opt for opt in options if opt["value"] == event.event_type), None)
-
-        client.views_open(
-            trigger_id=trigger_id,
-            view={
-                "type": "modal",
-                "callback_id": "submit_edit_event",
-                "private_metadata": str(event_id), # Store ID here
-                "title": {"type": "plain_text", "text": "Edit Event"},
-                "submit": {"type": "plain_text", "text": "Save Changes"},
-                "blocks": [
-                    {
-                        "type": "input", "block_id": "title", "label": {"type": "plain_text", "text": "Title"},
-                        "element": {"type": "plain_text_input", "action_id": "i", "initial_value": event.title}
-                    },
-                    {
-                        "type": "input", "block_id": "type", "label": {"type": "plain_text", "text": "Type"},
-                        "element": {"type": "static_select", "action_id": "i", "options": options, "initial_option": initial_option}
-                    },
-                    {
-                        "type": "input", "block_id": "date", "label": {"type": "plain_text", "text": "Event Date"},
-                        "element": {"type": "datepicker", "action_id": "i", "initial_date": event.event_date.strftime("%Y-%m-%d")}
-                    },
-                    {
-                        "type": "input", "block_id": "deadline", "label": {"type": "plain_text", "text": "Reg. Deadline"},
-                        "element": {"type": "datepicker", "action_id": "i", "initial_date": event.registration_deadline.strftime("%Y-%m-%d")}
-                    }
-                ]
-            }
-        )
+    event = db.session.get(Event, event_id)
+    if not event: return
+
+    options = get_category_options()
+    initial_option = next((opt for opt in options if opt["value"] == event.event_type), None)
+
+    client.views_open(
+        trigger_id=trigger_id,
+        view={
+            "type": "modal",
+            "callback_id": "submit_edit_event",
+            "private_metadata": str(event_id), # Store ID here
+            "title": {"type": "plain_text", "text": "Edit Event"},
+            "submit": {"type": "plain_text", "text": "Save Changes"},
+            "blocks": [
+                {
+                    "type": "input", "block_id": "title", "label": {"type": "plain_text", "text": "Title"},
+                    "element": {"type": "plain_text_input", "action_id": "i", "initial_value": event.title}
+                },
+                {
+                    "type": "input", "block_id": "type", "label": {"type": "plain_text", "text": "Type"},
+                    "element": {"type": "static_select", "action_id": "i", "options": options, "initial_option": initial_option}
+                },
+                {
+                    "type": "input", "block_id": "date", "label": {"type": "plain_text", "text": "Event Date"},
+                    "element": {"type": "datepicker", "action_id": "i", "initial_date": event.event_date.isoformat()}
+                },
+                {
+                    "type": "input", "block_id": "deadline", "label": {"type": "plain_text", "text": "Reg. Deadline"},
+                    "element": {"type": "datepicker", "action_id": "i", "initial_date": event.registration_deadline.isoformat()}
+                }
+            ]
+        }
+    )
 
 # -------------------------
 # 4. Bolt Handlers
@@ -414,16 +711,18 @@ def open_edit_event_modal(client, trigger_id, event_id):
 @bolt_app.command("/list-events")
 def handle_list_events(ack, respond):
     ack()
-    with flask_app.app_context():
-        events = Event.query.filter(Event.registration_deadline >= datetime.now().date()).order_by(Event.event_date).all()
-        if not events:
-            respond("📅 예정된 이벤트가 없습니다.")
-            return
-        
-        response = "*📅 다가오는 이벤트 목록:*\n"
-        for e in events:
-            response += f"• [ID: {e.id}] *{e.title}* ({e.event_type}) - {e.event_date} 데드라인: {e.registration_deadline}\n"
-        respond(response)
+    events = db.session.query(
+        Event.id, Event.title, Event.event_type, Event.event_date, Event.registration_deadline
+    ).filter(Event.registration_deadline >= date.today()).order_by(Event.event_date).all()
+    if not events:
+        respond("📅 예정된 이벤트가 없습니다.")
+        return
+    
+    response = "*📅 다가오는 이벤트 목록:*\n" + "".join(
+        f"• [ID: {e.id}] *{e.title}* ({e.event_type}) - {e.event_date} 데드라인: {e.registration_deadline}\n"
+        for e in events
+    )
+    respond(response)
 
 @bolt_app.command("/list-subs")
 def handle_list_subs(ack, respond, command):
@@ -434,25 +733,28 @@ def handle_list_subs(ack, respond, command):
     target_id = parse_channel_id(text) if text else None
     
     # Check permission
-    with flask_app.app_context():
-        if not is_user_admin(user_id):
-            respond("🚫 관리자만 볼 수 있습니다.")
-            return
-        
-        # Use JOIN to fetch subscriptions and events in one query
-        subs = db.session.query(Subscription, Event).join(Event).filter(Subscription.channel_id == target_id).all()
-        
-        if not subs:
-            respond(f"<#{target_id}> 님은 구독 중인 이벤트가 없습니다.")
-            return
-        
-        response = f"*📋 <#{target_id}> 님의 구독 리스트:*\n"
-        for sub, event in subs:
-            status = "미등록" if sub.status == 'Pending' else '등록완료'
-            if event and event.registration_deadline >= datetime.now().date():
-                response += f"• {event.title} - {event.event_date} 데드라인: {event.registration_deadline} *{status}*\n"
-        
-        respond(response)
+    if not is_user_admin(user_id):
+        respond("🚫 관리자만 볼 수 있습니다.")
+        return
+    
+    # One JOIN fetches just the rendered columns of each subscription and its (still open) event
+    subs = db.session.query(
+        Event.title, Event.event_date, Event.registration_deadline, Subscription.status
+    ).join(Subscription.event).filter(
+        Subscription.channel_id == target_id,
+        Event.registration_deadline >= date.today()
+    ).all()
+    
+    if not subs:
+        respond(f"<#{target_id}> 님은 구독 중인 이벤트가 없습니다.")
+        return
+    
+    response = f"*📋 <#{target_id}> 님의 구독 리스트:*\n" + "".join(
+        f"• {sub.title} - {sub.event_date} 데드라인: {sub.registration_deadline} *{'미등록' if sub.status == 'Pending' else '등록완료'}*\n"
+        for sub in subs
+    )
+    
+    respond(response)
 
 @bolt_app.command("/check-pending")
 def handle_check_pending(ack, respond, command):
@@ -460,34 +762,40 @@ def handle_check_pending(ack, respond, command):
     user_id = command["user_id"]
     query_text = command["text"].strip()
 
-    with flask_app.app_context():
-        if not is_user_admin(user_id):
-            respond("🚫 관리자 권한이 없습니다.")
-            return
+    if not is_user_admin(user_id):
+        respond("🚫 관리자 권한이 없습니다.")
+        return
 
-        # Find the event
-        event, err = find_event_by_query(query_text)
-        if err:
-            respond(err)
-            return
+    # Find the event
+    event, err = find_event_by_query(query_text)
+    if err:
+        respond(err)
+        return
 
-        # Find Pending Subscriptions
-        pending_subs = Subscription.query.filter_by(event_id=event.id, status="Pending").all()
-        registered_count = Subscription.query.filter_by(event_id=event.id, status="Registered").count()
-        
-        if not pending_subs:
-            respond(f"🎉 *{event.title}*: 모든 학생이 등록을 완료했습니다! ({registered_count}명 완료)")
-            return
+    # Per-status counts in one pass; channel IDs are only fetched when someone is still pending
+    counts = dict(
+        db.session.query(Subscription.status, db.func.count())
+        .filter(Subscription.event_id == event.id)
+        .group_by(Subscription.status)
+        .all()
+    )
+    registered_count = counts.get("Registered", 0)
+    
+    if not counts.get("Pending"):
+        respond(f"🎉 *{event.title}*: 모든 학생이 등록을 완료했습니다! ({registered_count}명 완료)")
+        return
 
-        # Build List
-        msg = f"🚨 *{event.title}* 미등록 학생 리스트 ({len(pending_subs)}명):\n"
-        for sub in pending_subs:
-            msg += f"• <#{sub.channel_id}>\n"
-        
-        msg += f"\n✅ 등록 완료: {registered_count}명"
-        msg += f"\n👉 `/nudge-pending {event.id}` 를 입력하여 알림을 보낼 수 있습니다."
-        
-        respond(msg)
+    pending_subs = db.session.query(Subscription.channel_id).filter_by(event_id=event.id, status="Pending").all()
+
+    # Build List
+    msg = (
+        f"🚨 *{event.title}* 미등록 학생 리스트 ({len(pending_subs)}명):\n"
+        + "".join(f"• <#{sub.channel_id}>\n" for sub in pending_subs)
+        + f"\n✅ 등록 완료: {registered_count}명"
+        + f"\n👉 `/nudge-pending {event.id}` 를 입력하여 알림을 보낼 수 있습니다."
+    )
+    
+    respond(msg)
 
 @bolt_app.command("/nudge-pending")
 def handle_nudge_pending(ack, respond, client, command):
@@ -495,55 +803,48 @@ def handle_nudge_pending(ack, respond, client, command):
     user_id = command["user_id"]
     query_text = command["text"].strip()
 
-    with flask_app.app_context():
-        if not is_user_admin(user_id):
-            respond("🚫 관리자 권한이 없습니다.")
-            return
+    if not is_user_admin(user_id):
+        respond("🚫 관리자 권한이 없습니다.")
+        return
 
-        # Find the event
-        event, err = find_event_by_query(query_text)
-        if err:
-            respond(err)
-            return
+    # Find the event
+    event, err = find_event_by_query(query_text)
+    if err:
+        respond(err)
+        return
 
-        # Find Pending Subscriptions
-        pending_subs = Subscription.query.filter_by(event_id=event.id, status="Pending").all()
-        
-        if not pending_subs:
-            respond(f"✅ *{event.title}*: 알림을 보낼 대상이 없습니다 (모두 등록 완료).")
-            return
+    # Find Pending Subscriptions
+    pending_subs = db.session.query(Subscription.channel_id).filter_by(event_id=event.id, status="Pending").all()
+    
+    if not pending_subs:
+        respond(f"✅ *{event.title}*: 알림을 보낼 대상이 없습니다 (모두 등록 완료).")
+        return
 
-        count = 0
-        for sub in pending_subs:
-            try:
-                # Send the Nudge DM
-                client.chat_postMessage(
-                    channel=sub.channel_id,
-                    text=f"👋 안녕하세요! 담당 컨설턴트가 *{event.title}* 등록 여부를 확인 중입니다.",
-                    blocks=[
-                        {
-                            "type": "section",
-                            "text": {"type": "mrkdwn", "text": f"👋 안녕하세요! \n*{event.title}* 등록을 아직 완료하지 않으신 것 같습니다.\n확인 부탁드립니다!"}
-                        },
-                        {
-                            "type": "actions",
-                            "elements": [
-                                {
-                                    "type": "button",
-                                    "text": {"type": "plain_text", "text": "✅ 등록 완료"},
-                                    "style": "primary",
-                                    "value": str(event.id),
-                                    "action_id": "confirm_registration"
-                                }
-                            ]
-                        }
-                    ]
-                )
-                count += 1
-            except Exception as e:
-                logger.error(f"Failed to nudge {sub.channel_id}: {e}")
+    # The nudge is identical for every student; send them concurrently
+    nudge = {
+        "text": f"👋 안녕하세요! 담당 컨설턴트가 *{event.title}* 등록 여부를 확인 중입니다.",
+        "blocks": [
+            {
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": f"👋 안녕하세요! \n*{event.title}* 등록을 아직 완료하지 않으신 것 같습니다.\n확인 부탁드립니다!"}
+            },
+            {
+                "type": "actions",
+                "elements": [
+                    {
+                        "type": "button",
+                        "text": {"type": "plain_text", "text": "✅ 등록 완료"},
+                        "style": "primary",
+                        "value": str(event.id),
+                        "action_id": "confirm_registration"
+                    }
+                ]
+            }
+        ]
+    }
+    count = post_messages(client, [dict(nudge, channel=sub.channel_id) for sub in pending_subs])
 
-        respond(f"📨 *{event.title}*: 미등록 학생 *{count}명*에게 알림을 발송했습니다.")
+    respond(f"📨 *{event.title}*: 미등록 학생 *{count}명*에게 알림을 발송했습니다.")
 
 #sends messages to all students subscribed to an event
 @bolt_app.command("/send-event-message")
@@ -552,30 +853,9 @@ def open_send_message_modal(ack, body, client):
     user_id = body["user_id"]
     channel_id = body['channel_id']
     
-    with flask_app.app_context():
-        if not is_user_admin(user_id):
-            client.chat_postEphemeral(channel=channel_id, user=user_id, text="🚫 관리자 권한이 없습니다.")
-            return
-        
-        # Fetch upcoming events
-        events = Event.query.filter(Event.registration_deadline >= datetime.now().date())\
-                            .order_by(Event.event_date)\
-                            .limit(100).all()
-        
-        event_options = []
-        for e in events:
-            date_str = e.event_date.strftime('%Y-%m-%d')
-            safe_title = e.title
-            safe_cat = e.event_type
-            occupied_len = len(safe_cat) + len(date_str) + 2
-            if len(safe_title) > 75 - (occupied_len + 6):
-                safe_title = safe_title[:occupied_len - 6] + "..."
-            
-            label_text = f"{safe_cat} {safe_title} ({date_str})"
-            event_options.append({
-                "text": {"type": "plain_text", "text": label_text},
-                "value": str(e.id)
-            })
+    if not is_user_admin(user_id):
+        client.chat_postEphemeral(channel=channel_id, user=user_id, text="🚫 관리자 권한이 없습니다.")
+        return
     
     client.views_open(
         trigger_id=body["trigger_id"],
@@ -598,7 +878,7 @@ def open_send_message_modal(ack, body, client):
                         "type": "external_select",
                         "action_id": "event_search",
                         "placeholder": {"type": "plain_text", "text": "이벤트 이름 검색..."},
-                        "min_query_length": 1
+                        "min_query_length": MIN_SEARCH_LEN
                     }
                 },
                 {
@@ -640,41 +920,35 @@ def handle_send_message_submission(ack, body, view, client):
     event_id = int(selected_event["value"])
     
     try:
-        with flask_app.app_context():
-            event = Event.query.get(event_id)
-            if not event:
-                client.chat_postEphemeral(channel=channel_id, user=admin_id, text="⚠️ 이벤트를 찾을 수 없습니다.")
-                return
-            
-            # Fetch subscribers
-            subs = Subscription.query.filter_by(event_id=event_id).all()
-            
-            if not subs:
-                client.chat_postEphemeral(channel=channel_id, user=admin_id, text=f"ℹ️ *{event.title}*: 구독한 채널이 없습니다.")
-                return
-            
-            count = 0
-            for sub in subs:
-                try:
-                    client.chat_postMessage(
-                        channel=sub.channel_id,
-                        text=message_text,
-                        blocks=[
-                            {
-                                "type": "section",
-                                "text": {"type": "mrkdwn", "text": f"📢 *{event.title}* 관련 공지\n\n{message_text}"}
-                            }
-                        ]
-                    )
-                    count += 1
-                except Exception as e:
-                    print(f"Failed to send message to {sub.channel_id}: {e}")
-            
-            # Final success message to Admin
-            client.chat_postEphemeral(channel=channel_id, user=admin_id, text=f"📨 *{event.title}*: {count}개 채널에 메시지를 발송했습니다.")
+        # Only the title is shown
+        event_title = db.session.query(Event.title).filter_by(id=event_id).scalar()
+        if event_title is None:
+            client.chat_postEphemeral(channel=channel_id, user=admin_id, text="⚠️ 이벤트를 찾을 수 없습니다.")
+            return
+        
+        # Fetch subscribers
+        subs = db.session.query(Subscription.channel_id).filter_by(event_id=event_id).all()
+        
+        if not subs:
+            client.chat_postEphemeral(channel=channel_id, user=admin_id, text=f"ℹ️ *{event_title}*: 구독한 채널이 없습니다.")
+            return
+        
+        # Same announcement to every subscriber; send them concurrently
+        blocks = [
+            {
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": f"📢 *{event_title}* 관련 공지\n\n{message_text}"}
+            }
+        ]
+        count = post_messages(client, [
+            {"channel": sub.channel_id, "text": message_text, "blocks": blocks} for sub in subs
+        ])
+        
+        # Final success message to Admin
+        client.chat_postEphemeral(channel=channel_id, user=admin_id, text=f"📨 *{event_title}*: {count}개 채널에 메시지를 발송했습니다.")
 
     except Exception as e:
-        print(f"Submission Error: {e}")
+        logger.error("Submission Error: %s", e)
         client.chat_postMessage(channel=admin_id, text=f"❌ 발송 중 오류 발생: {str(e)}")
 
 @bolt_app.command("/track")
@@ -689,97 +963,96 @@ def handle_track_command(ack, respond, command):
         respond("⚠️ 사용법:\n`/track #channel` (조회)\n`/track add #channel` (추가)\n`/track remove #channel` (제거)\n`/track list` (목록)")
         return
 
-    with flask_app.app_context():
-        if not is_user_admin(admin_id):
-            respond("🚫 관리자 권한이 없습니다.")
+    if not is_user_admin(admin_id):
+        respond("🚫 관리자 권한이 없습니다.")
+        return
+
+    # 1. Try to see if the first word is a channel ID (Direct View)
+    # We don't lowercase it yet because IDs are case-sensitive
+    direct_target = parse_channel_id(parts[0])
+    
+    # 2. Logic Router
+    action = parts[0].lower()
+
+    # --- ACTION: ADD ---
+    if action == "add" and len(parts) > 1:
+        target_id = parse_channel_id(parts[1])
+        if not target_id:
+            respond("⚠️ 유효한 채널 태그가 아닙니다.")
             return
 
-        # 1. Try to see if the first word is a channel ID (Direct View)
-        # We don't lowercase it yet because IDs are case-sensitive
-        direct_target = parse_channel_id(parts[0])
+        # The unique constraint decides; rowcount tells us whether the row was new
+        added = insert_ignore(TrackedStudent, {"consultant_id": admin_id, "channel_id": target_id}).rowcount
+        db.session.commit()
+        if added:
+            respond(f"✅ 이제 <#{target_id}> 학생을 추적 관리합니다.")
+        else:
+            respond(f"ℹ️ <#{target_id}> 학생은 이미 목록에 있습니다.")
+
+    # --- ACTION: REMOVE ---
+    elif action == "remove" and len(parts) > 1:
+        target_id = parse_channel_id(parts[1])
+        if not target_id: return
+
+        removed = TrackedStudent.query.filter_by(consultant_id=admin_id, channel_id=target_id).delete()
+        db.session.commit()
+        if removed:
+            respond(f"🗑️ <#{target_id}> 학생을 목록에서 제거했습니다.")
+        else:
+            respond("⚠️ 목록에 없는 학생입니다.")
+
+    # --- ACTION: LIST ---
+    elif action == "list":
+        tracked = db.session.query(TrackedStudent.channel_id).filter_by(consultant_id=admin_id).all()
+        if not tracked:
+            respond("📭 현재 추적 중인 학생이 없습니다.")
+            return
         
-        # 2. Logic Router
-        action = parts[0].lower()
-
-        # --- ACTION: ADD ---
-        if action == "add" and len(parts) > 1:
-            target_id = parse_channel_id(parts[1])
-            if not target_id:
-                respond("⚠️ 유효한 채널 태그가 아닙니다.")
-                return
+        msg = "*📋 내 담당 학생 리스트:*\n" + "".join(f"• <#{t.channel_id}>\n" for t in tracked)
+        respond(msg)
 
-            if not TrackedStudent.query.filter_by(consultant_id=admin_id, channel_id=target_id).first():
-                db.session.add(TrackedStudent(consultant_id=admin_id, channel_id=target_id))
-                db.session.commit()
-                respond(f"✅ 이제 <#{target_id}> 학생을 추적 관리합니다.")
-            else:
-                respond(f"ℹ️ <#{target_id}> 학생은 이미 목록에 있습니다.")
-
-        # --- ACTION: REMOVE ---
-        elif action == "remove" and len(parts) > 1:
-            target_id = parse_channel_id(parts[1])
-            if not target_id: return
-
-            entry = TrackedStudent.query.filter_by(consultant_id=admin_id, channel_id=target_id).first()
-            if entry:
-                db.session.delete(entry)
-                db.session.commit()
-                respond(f"🗑️ <#{target_id}> 학생을 목록에서 제거했습니다.")
-            else:
-                respond("⚠️ 목록에 없는 학생입니다.")
+    # --- ACTION: VIEW DETAILS ---
+    # Triggered by '/track #channel' OR '/track show #channel'
+    elif direct_target or (action == "show" and len(parts) > 1):
+        target_id = direct_target if direct_target else parse_channel_id(parts[1])
+        
+        if not target_id:
+            respond("⚠️ 채널을 지정해주세요.")
+            return
 
-        # --- ACTION: LIST ---
-        elif action == "list":
-            tracked = TrackedStudent.query.filter_by(consultant_id=admin_id).all()
-            if not tracked:
-                respond("📭 현재 추적 중인 학생이 없습니다.")
-                return
-            
-            msg = "*📋 내 담당 학생 리스트:*\n"
-            for t in tracked:
-                # FIX: Ensure this matches your DB column (channel_id)
-                msg += f"• <#{t.channel_id}>\n" 
-            respond(msg)
-
-        # --- ACTION: VIEW DETAILS ---
-        # Triggered by '/track #channel' OR '/track show #channel'
-        elif direct_target or (action == "show" and len(parts) > 1):
-            target_id = direct_target if direct_target else parse_channel_id(parts[1])
-            
-            if not target_id:
-                respond("⚠️ 채널을 지정해주세요.")
-                return
+        # Fetch Student Details
+        subs = Subscription.query.join(Subscription.event).options(contains_eager(Subscription.event)).filter(
+            Subscription.channel_id == target_id
+        ).order_by(Event.event_date).all()
+        
+        if not subs:
+            respond(f"📂 <#{target_id}> 학생은 현재 구독 중인 이벤트가 없습니다.")
+            return
 
-            # Fetch Student Details
-            subs = db.session.query(Subscription, Event).join(Event).filter(Subscription.channel_id == target_id).order_by(Event.event_date).all()
+        response_text = f"*👤 학생 분석 보고서: <#{target_id}>*\n\n"
+        today = date.today()
+        upcoming_lines = []
+        history_lines = []
+        
+        for sub in subs:
+            event = sub.event
+            status_icon = "✅" if sub.status == "Registered" else "⏳"
+            status_text = "등록 완료" if sub.status == "Registered" else "미등록 (Pending)"
+            line = f"• {status_icon} *{event.title}* | 📅 {event.event_date} | *{status_text}*\n"
             
-            if not subs:
-                respond(f"📂 <#{target_id}> 학생은 현재 구독 중인 이벤트가 없습니다.")
-                return
+            if event.event_date >= today:
+                if sub.status == "Pending" and event.registration_deadline <= (today + timedelta(days=3)):
+                    line += f"    🚨 *경고: 마감 임박 ({event.registration_deadline})*\n"
+                upcoming_lines.append(line)
+            else:
+                history_lines.append(line)
 
-            response_text = f"*👤 학생 분석 보고서: <#{target_id}>*\n\n"
-            today = datetime.now().date()
-            upcoming_txt = ""
-            history_txt = ""
-            
-            for sub, event in subs:
-                status_icon = "✅" if sub.status == "Registered" else "⏳"
-                status_text = "등록 완료" if sub.status == "Registered" else "미등록 (Pending)"
-                line = f"• {status_icon} *{event.title}* | 📅 {event.event_date} | *{status_text}*\n"
-                
-                if event.event_date >= today:
-                    if sub.status == "Pending" and event.registration_deadline <= (today + timedelta(days=3)):
-                        line += f"    🚨 *경고: 마감 임박 ({event.registration_deadline})*\n"
-                    upcoming_txt += line
-                else:
-                    history_txt += line
-
-            if upcoming_txt: response_text += "*📅 예정된 일정:*\n" + upcoming_txt + "\n"
-            if history_txt: response_text += "*📜 지난 일정:*\n" + history_txt
-            respond(response_text)
-            
-        else:
-            respond("⚠️ 알 수 없는 명령어입니다. `/track #channel` 혹은 `/track list`를 사용하세요.")
+        if upcoming_lines: response_text += "*📅 예정된 일정:*\n" + "".join(upcoming_lines) + "\n"
+        if history_lines: response_text += "*📜 지난 일정:*\n" + "".join(history_lines)
+        respond(response_text)
+        
+    else:
+        respond("⚠️ 알 수 없는 명령어입니다. `/track #channel` 혹은 `/track list`를 사용하세요.")
 
 @bolt_app.command("/admin-sub")
 def open_admin_sub_modal(ack, body, client, command):
@@ -787,87 +1060,14 @@ def open_admin_sub_modal(ack, body, client, command):
     user_id = command["user_id"]
     channel_id = body['channel_id']
     # 1. Fetch upcoming events for the dropdown
-    with flask_app.app_context():
-        if not is_user_admin(user_id):
-            client.chat_postEphemeral(channel=user_id, user=user_id, text="🚫 관리자 권한이 없습니다.")
-            return
+    if not is_user_admin(user_id):
+        client.chat_postEphemeral(channel=user_id, user=user_id, text="🚫 관리자 권한이 없습니다.")
+        return
 
     # 2. Open the Modal
     client.views_open(
         trigger_id=body["trigger_id"],
-        view={
-            "type": "modal",
-            "callback_id": "submit_admin_sub",
-            "private_metadata": channel_id,
-            "title": {"type": "plain_text", "text": "구독"},
-            "submit": {"type": "plain_text", "text": "유저 구독하기"},
-            "blocks": [
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": "유저를 선택하고 이벤트를 지정하세요."}
-                },
-                # Input 1: User Picker
-                {
-                    "type": "input",
-                    "block_id": "target_user",
-                    "label": {"type": "plain_text", "text": "유저 선택"},
-                    "element": {
-                        "type": "conversations_select",
-                        "action_id": "conversations_select",
-                        "placeholder": {"type": "plain_text", "text": "유저를 선택하세요"},
-                        "filter": {
-                            "include": [
-                                "public",
-                                "private"
-                            ],
-                            "exclude_bot_users": True
-                        }
-                    }
-                },
-                # Input 2: Action Type (Single Event or Category?)
-                {
-                    "type": "input",
-                    "block_id": "sub_type",
-                    "label": {"type": "plain_text", "text": "모드"},
-                    "element": {
-                        "type": "static_select",
-                        "action_id": "mode_select",
-                        "initial_option": {"text": {"type": "plain_text", "text": "1개 이벤트"}, "value": "item"},
-                        "options": [
-                            {"text": {"type": "plain_text", "text": "1개 이벤트"}, "value": "item"},
-                            {"text": {"type": "plain_text", "text": "카테고리"}, "value": "cat"},
-                            {"text": {"type": "plain_text", "text": "모든 이벤트"}, "value": "all"}
-                        ]
-                    }
-                },
-                # Input 3: Event Picker (Searchable Dropdown)
-                # Note: This is optional because "All" doesn't need it.
-                {
-                    "type": "input",
-                    "block_id": "event_select",
-                    "optional": True, 
-                    "label": {"type": "plain_text", "text": "이벤트 선택 (이름 검색)"},
-                    "element": {
-                        "type": "external_select",
-                        "action_id": "event_id",
-                        "placeholder": {"type": "plain_text", "text": "검색어 입력"},
-                        "min_query_length": 1
-                    }
-                },
-                # Input 4: Category Picker (Only needed if Mode is Category)
-                {
-                    "type": "input",
-                    "block_id": "cat_select",
-                    "optional": True,
-                    "label": {"type": "plain_text", "text": "카테고리 선택 (카테고리 모드를 선택했을경우)"},
-                    "element": {
-                        "type": "static_select",
-                        "action_id": "cat_name",
-                        "options": get_category_options() 
-                    }
-                }
-            ]
-        }
+        view=build_admin_sub_view(channel_id)
     )
 
 @bolt_app.command("/admin-register")
@@ -876,91 +1076,155 @@ def open_admin_register_modal(ack, body, client, command):
     user_id = command["user_id"]
     channel_id = body['channel_id']
     # 1. Fetch upcoming events for the dropdown
-    with flask_app.app_context():
-        if not is_user_admin(user_id):
-            client.chat_postEphemeral(channel=user_id, user=user_id, text="🚫 관리자 권한이 없습니다.")
-            return
+    if not is_user_admin(user_id):
+        client.chat_postEphemeral(channel=user_id, user=user_id, text="🚫 관리자 권한이 없습니다.")
+        return
 
     # 2. Open the Modal
     client.views_open(
         trigger_id=body["trigger_id"],
-        view={
-            "type": "modal",
-            "callback_id": "submit_admin_register",
-            "private_metadata": channel_id,
-            "title": {"type": "plain_text", "text": "등록"},
-            "submit": {"type": "plain_text", "text": "유저 등록하기"},
-            "blocks": [
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": "유저를 선택하고 이벤트를 지정하세요."}
-                },
-                # Input 1: User Picker
-                {
-                    "type": "section",
-                    "block_id": "target_user",
-                    "text": {"type": "mrkdwn", "text": "*채널/유저 선택*"},
-                    "accessory": {
-                        "type": "conversations_select",
-                        "action_id": "conversations_select",
-                        "placeholder": {"type": "plain_text", "text": "채널을 선택하세요"},
-                        "filter": {
-                            "include": ["public", "private"],
-                            "exclude_bot_users": True
-                        }
-                    }
-                },
-                # Input 2: Action Type (Single Event or Category?)
-                {
-                    "type": "input",
-                    "block_id": "sub_type",
-                    "label": {"type": "plain_text", "text": "모드"},
-                    "element": {
-                        "type": "static_select",
-                        "action_id": "mode_select",
-                        "initial_option": {"text": {"type": "plain_text", "text": "1개 이벤트"}, "value": "item"},
-                        "options": [
-                            {"text": {"type": "plain_text", "text": "1개 이벤트"}, "value": "item"},
-                            {"text": {"type": "plain_text", "text": "카테고리"}, "value": "cat"},
-                            {"text": {"type": "plain_text", "text": "모든 이벤트"}, "value": "all"}
-                        ]
-                    }
-                },
-                # Input 3: Event Picker (Searchable Dropdown)
-                # Note: This is optional because "All" doesn't need it.
-                {
-                    "type": "input",
-                    "block_id": "event_select",
-                    "optional": True,
-                    "label": {"type": "plain_text", "text": "이벤트 선택"},
-                    "element": {
-                        "type": "external_select",
-                        "action_id": "event_subscribed",
-                        "placeholder": {"type": "plain_text", "text": "이벤트 선택"},
-                        "min_query_length": 0  # <--- Change this to 0 to auto-load on click
-                    }
-                },
-                # Input 4: Category Picker (Only needed if Mode is Category)
-                {
-                    "type": "input",
-                    "block_id": "cat_select",
-                    "optional": True,
-                    "label": {"type": "plain_text", "text": "카테고리 선택 (카테고리 모드를 선택했을경우)"},
-                    "element": {
-                        "type": "static_select",
-                        "action_id": "cat_name",
-                        "options": get_category_options() 
-                    }
-                }
-            ]
-        }
+        view=build_admin_register_view(channel_id)
     )
 
-# Helper for category options
-def get_category_options():
-    with flask_app.app_context():
-        cats = EventType.query.all()
-        return [{"text": {"type": "plain_text", "text": c.name}, "value": c.name} for c in cats]
+# Helper for category options
+@functools.lru_cache(maxsize=8)
+def _build_type_options(names):
+    return [{"text": {"type": "plain_text", "text": c}, "value": c} for c in names]
+
+def get_category_options():
+    """static_select options for every category; the list is shared while the categories are unchanged."""
+    return _build_type_options(tuple(get_event_types()))
+
+# Static blocks of the admin subscribe / register modals, built once.
+# Slack only serializes these, so every view can share them; only private_metadata and the category options vary.
+_MODE_SELECT_BLOCK = {
+    "type": "input",
+    "block_id": "sub_type",
+    "label": {"type": "plain_text", "text": "모드"},
+    "element": {
+        "type": "static_select",
+        "action_id": "mode_select",
+        "initial_option": {"text": {"type": "plain_text", "text": "1개 이벤트"}, "value": "item"},
+        "options": [
+            {"text": {"type": "plain_text", "text": "1개 이벤트"}, "value": "item"},
+            {"text": {"type": "plain_text", "text": "카테고리"}, "value": "cat"},
+            {"text": {"type": "plain_text", "text": "모든 이벤트"}, "value": "all"}
+        ]
+    }
+}
+
+_ADMIN_SUB_BLOCKS = (
+    {
+        "type": "section",
+        "text": {"type": "mrkdwn", "text": "유저를 선택하고 이벤트를 지정하세요."}
+    },
+    # Input 1: User Picker
+    {
+        "type": "input",
+        "block_id": "target_user",
+        "label": {"type": "plain_text", "text": "유저 선택"},
+        "element": {
+            "type": "conversations_select",
+            "action_id": "conversations_select",
+            "placeholder": {"type": "plain_text", "text": "유저를 선택하세요"},
+            "filter": {
+                "include": [
+                    "public",
+                    "private"
+                ],
+                "exclude_bot_users": True
+            }
+        }
+    },
+    # Input 2: Action Type (Single Event or Category?)
+    _MODE_SELECT_BLOCK,
+    # Input 3: Event Picker (Searchable Dropdown)
+    # Note: This is optional because "All" doesn't need it.
+    {
+        "type": "input",
+        "block_id": "event_select",
+        "optional": True, 
+        "label": {"type": "plain_text", "text": "이벤트 선택 (이름 검색)"},
+        "element": {
+            "type": "external_select",
+            "action_id": "event_id",
+            "placeholder": {"type": "plain_text", "text": "검색어 입력"},
+            "min_query_length": MIN_SEARCH_LEN
+        }
+    },
+)
+
+_ADMIN_REGISTER_BLOCKS = (
+    {
+        "type": "section",
+        "text": {"type": "mrkdwn", "text": "유저를 선택하고 이벤트를 지정하세요."}
+    },
+    # Input 1: User Picker
+    {
+        "type": "section",
+        "block_id": "target_user",
+        "text": {"type": "mrkdwn", "text": "*채널/유저 선택*"},
+        "accessory": {
+            "type": "conversations_select",
+            "action_id": "conversations_select",
+            "placeholder": {"type": "plain_text", "text": "채널을 선택하세요"},
+            "filter": {
+                "include": ["public", "private"],
+                "exclude_bot_users": True
+            }
+        }
+    },
+    # Input 2: Action Type (Single Event or Category?)
+    _MODE_SELECT_BLOCK,
+    # Input 3: Event Picker (Searchable Dropdown)
+    # Note: This is optional because "All" doesn't need it.
+    {
+        "type": "input",
+        "block_id": "event_select",
+        "optional": True,
+        "label": {"type": "plain_text", "text": "이벤트 선택"},
+        "element": {
+            "type": "external_select",
+            "action_id": "event_subscribed",
+            "placeholder": {"type": "plain_text", "text": "이벤트 선택"},
+            "min_query_length": 0  # <--- Change this to 0 to auto-load on click
+        }
+    },
+)
+
+def _category_select_block():
+    """Input 4: Category Picker (Only needed if Mode is Category)"""
+    return {
+        "type": "input",
+        "block_id": "cat_select",
+        "optional": True,
+        "label": {"type": "plain_text", "text": "카테고리 선택 (카테고리 모드를 선택했을경우)"},
+        "element": {
+            "type": "static_select",
+            "action_id": "cat_name",
+            "options": get_category_options()
+        }
+    }
+
+def build_admin_sub_view(private_metadata):
+    return {
+        "type": "modal",
+        "callback_id": "submit_admin_sub",
+        "private_metadata": private_metadata,
+        "title": {"type": "plain_text", "text": "구독"},
+        "submit": {"type": "plain_text", "text": "유저 구독하기"},
+        "blocks": [*_ADMIN_SUB_BLOCKS, _category_select_block()]
+    }
+
+def build_admin_register_view(private_metadata):
+    return {
+        "type": "modal",
+        "callback_id": "submit_admin_register",
+        "private_metadata": private_metadata,
+        "title": {"type": "plain_text", "text": "등록"},
+        "submit": {"type": "plain_text", "text": "유저 등록하기"},
+        "blocks": [*_ADMIN_REGISTER_BLOCKS, _category_select_block()]
+    }
 
 
 @bolt_app.action("conversations_select")
@@ -993,49 +1257,42 @@ def handle_channel_selection(ack, body, client):
 # --- Navigation & Home ---
 @bolt_app.event("app_home_opened")
 def update_home_tab(client, event, logger):
-    with flask_app.app_context():
-        blocks = get_dashboard_view(event["user"])
-        client.views_publish(user_id=event["user"], view={"type": "home", "blocks": blocks})
+    blocks = get_dashboard_view(event["user"])
+    client.views_publish(user_id=event["user"], view={"type": "home", "blocks": blocks})
 
 @bolt_app.action("nav_home")
 def go_home(ack, body, client):
     ack()
-    with flask_app.app_context():
-        blocks = get_dashboard_view(body["user"]["id"])
-        client.views_publish(user_id=body["user"]["id"], view={"type": "home", "blocks": blocks})
+    blocks = get_dashboard_view(body["user"]["id"])
+    client.views_publish(user_id=body["user"]["id"], view={"type": "home", "blocks": blocks})
 
 @bolt_app.action("nav_view_category")
 def go_category(ack, body, client):
     ack()
     category = body["actions"][0]["value"]
-    with flask_app.app_context():
-        blocks = get_category_view(body["user"]["id"], category, page=0)
-        client.views_publish(user_id=body["user"]["id"], view={"type": "home", "blocks": blocks})
+    blocks = get_category_view(body["user"]["id"], category, page=0)
+    client.views_publish(user_id=body["user"]["id"], view={"type": "home", "private_metadata": f"cat|{category}|0", "blocks": blocks})
 
 @bolt_app.action("nav_prev_page")
 def prev_page(ack, body, client):
     ack()
     cat, page = body["actions"][0]["value"].split("|")
-    with flask_app.app_context():
-        blocks = get_category_view(body["user"]["id"], cat, int(page))
-        client.views_publish(user_id=body["user"]["id"], view={"type": "home", "blocks": blocks})
+    blocks = get_category_view(body["user"]["id"], cat, int(page))
+    client.views_publish(user_id=body["user"]["id"], view={"type": "home", "private_metadata": f"cat|{cat}|{page}", "blocks": blocks})
 
 @bolt_app.action("nav_next_page")
 def next_page(ack, body, client):
     ack()
     cat, page = body["actions"][0]["value"].split("|")
-    with flask_app.app_context():
-        blocks = get_category_view(body["user"]["id"], cat, int(page))
-        client.views_publish(user_id=body["user"]["id"], view={"type": "home", "blocks": blocks})
+    blocks = get_category_view(body["user"]["id"], cat, int(page))
+    client.views_publish(user_id=body["user"]["id"], view={"type": "home", "private_metadata": f"cat|{cat}|{page}", "blocks": blocks})
 
 # --- Admin Modals (Open) ---
 @bolt_app.action("open_add_event_modal")
 def open_event_modal(ack, body, client):
     ack()
-    with flask_app.app_context():
-        types = EventType.query.all()
-        options = [{"text": {"type": "plain_text", "text": t.name}, "value": t.name} for t in types]
-        
+    options = get_category_options()
+    
     client.views_open(
         trigger_id=body["trigger_id"],
         view={
@@ -1084,76 +1341,7 @@ def open_admin_register_modal_(ack, body, client):
     # 2. Open the Modal
     client.views_open(
         trigger_id=body["trigger_id"],
-        view={
-            "type": "modal",
-            "callback_id": "submit_admin_register",
-            "private_metadata": user_id,
-            "title": {"type": "plain_text", "text": "등록"},
-            "submit": {"type": "plain_text", "text": "유저 등록하기"},
-            "blocks": [
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": "유저를 선택하고 이벤트를 지정하세요."}
-                },
-                # Input 1: User Picker
-                {
-                    "type": "section",
-                    "block_id": "target_user",
-                    "text": {"type": "mrkdwn", "text": "*채널/유저 선택*"},
-                    "accessory": {
-                        "type": "conversations_select",
-                        "action_id": "conversations_select",
-                        "placeholder": {"type": "plain_text", "text": "채널을 선택하세요"},
-                        "filter": {
-                            "include": ["public", "private"],
-                            "exclude_bot_users": True
-                        }
-                    }
-                },
-                # Input 2: Action Type (Single Event or Category?)
-                {
-                    "type": "input",
-                    "block_id": "sub_type",
-                    "label": {"type": "plain_text", "text": "모드"},
-                    "element": {
-                        "type": "static_select",
-                        "action_id": "mode_select",
-                        "initial_option": {"text": {"type": "plain_text", "text": "1개 이벤트"}, "value": "item"},
-                        "options": [
-                            {"text": {"type": "plain_text", "text": "1개 이벤트"}, "value": "item"},
-                            {"text": {"type": "plain_text", "text": "카테고리"}, "value": "cat"},
-                            {"text": {"type": "plain_text", "text": "모든 이벤트"}, "value": "all"}
-                        ]
-                    }
-                },
-                # Input 3: Event Picker (Searchable Dropdown)
-                # Note: This is optional because "All" doesn't need it.
-                {
-                    "type": "input",
-                    "block_id": "event_select",
-                    "optional": True,
-                    "label": {"type": "plain_text", "text": "이벤트 선택"},
-                    "element": {
-                        "type": "external_select",
-                        "action_id": "event_subscribed",
-                        "placeholder": {"type": "plain_text", "text": "이벤트 선택"},
-                        "min_query_length": 0  # <--- Change this to 0 to auto-load on click
-                    }
-                },
-                # Input 4: Category Picker (Only needed if Mode is Category)
-                {
-                    "type": "input",
-                    "block_id": "cat_select",
-                    "optional": True,
-                    "label": {"type": "plain_text", "text": "카테고리 선택 (카테고리 모드를 선택했을경우)"},
-                    "element": {
-                        "type": "static_select",
-                        "action_id": "cat_name",
-                        "options": get_category_options() 
-                    }
-                }
-            ]
-        }
+        view=build_admin_register_view(user_id)
     )
 
 @bolt_app.action("open_admin_sub_modal")
@@ -1164,79 +1352,7 @@ def open_admin_sub_modal_(ack, body, client):
     # 2. Open the Modal
     client.views_open(
         trigger_id=body["trigger_id"],
-        view={
-            "type": "modal",
-            "callback_id": "submit_admin_sub",
-            "private_metadata": user_id,
-            "title": {"type": "plain_text", "text": "구독"},
-            "submit": {"type": "plain_text", "text": "유저 구독하기"},
-            "blocks": [
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": "유저를 선택하고 이벤트를 지정하세요."}
-                },
-                # Input 1: User Picker
-                {
-                    "type": "input",
-                    "block_id": "target_user",
-                    "label": {"type": "plain_text", "text": "유저 선택"},
-                    "element": {
-                        "type": "conversations_select",
-                        "action_id": "conversations_select",
-                        "placeholder": {"type": "plain_text", "text": "유저를 선택하세요"},
-                        "filter": {
-                            "include": [
-                                "public",
-                                "private"
-                            ],
-                            "exclude_bot_users": True
-                        }
-                    }
-                },
-                # Input 2: Action Type (Single Event or Category?)
-                {
-                    "type": "input",
-                    "block_id": "sub_type",
-                    "label": {"type": "plain_text", "text": "모드"},
-                    "element": {
-                        "type": "static_select",
-                        "action_id": "mode_select",
-                        "initial_option": {"text": {"type": "plain_text", "text": "1개 이벤트"}, "value": "item"},
-                        "options": [
-                            {"text": {"type": "plain_text", "text": "1개 이벤트"}, "value": "item"},
-                            {"text": {"type": "plain_text", "text": "카테고리"}, "value": "cat"},
-                            {"text": {"type": "plain_text", "text": "모든 이벤트"}, "value": "all"}
-                        ]
-                    }
-                },
-                # Input 3: Event Picker (Searchable Dropdown)
-                # Note: This is optional because "All" doesn't need it.
-                {
-                    "type": "input",
-                    "block_id": "event_select",
-                    "optional": True, 
-                    "label": {"type": "plain_text", "text": "이벤트 선택 (이름 검색)"},
-                    "element": {
-                        "type": "external_select",
-                        "action_id": "event_id",
-                        "placeholder": {"type": "plain_text", "text": "검색어 입력"},
-                        "min_query_length": 1
-                    }
-                },
-                # Input 4: Category Picker (Only needed if Mode is Category)
-                {
-                    "type": "input",
-                    "block_id": "cat_select",
-                    "optional": True,
-                    "label": {"type": "plain_text", "text": "카테고리 선택 (카테고리 모드를 선택했을경우)"},
-                    "element": {
-                        "type": "static_select",
-                        "action_id": "cat_name",
-                        "options": get_category_options() 
-                    }
-                }
-            ]
-        }
+        view=build_admin_sub_view(user_id)
     )
 
 
@@ -1249,72 +1365,80 @@ def handle_registration_confirm(ack, body, client):
     target_channel_id = body["channel"]["id"]
     event_id = int(body["actions"][0]["value"])
     
-    with flask_app.app_context():
-        # Look up by channel_id
-        sub = Subscription.query.filter_by(channel_id=target_channel_id, event_id=event_id).first()
-        
-        # DEBUG: Print to logs if not found
-        if not sub:
-            print(f"DEBUG: No sub found for channel {target_channel_id} and event {event_id}")
-            return
+    # Look up by channel_id; the event title comes back on the same round-trip
+    row = db.session.query(Subscription, Event.title).join(Subscription.event).filter(
+        Subscription.channel_id == target_channel_id,
+        Subscription.event_id == event_id
+    ).first()
+    
+    # Log (debug level) if not found
+    if not row:
+        logger.debug("No sub found for channel %s and event %s", target_channel_id, event_id)
+        return
+    sub, event_title = row
 
-        if sub.status == "Pending":
-            sub.status = "Registered"
-            
-            # Fetch event details
-            event = Event.query.get(event_id)
+    if sub.status == "Pending":
+        sub.status = "Registered"
+        
+        # 2. Update UI: Remove the button so they can't click it again
+        # A reminder DM can hold several events, so only this event's button blocks are replaced
+        try:
+            blocks = body.get("message", {}).get("blocks", [])
+            confirmed = {"type": "context", "elements": [{"type": "mrkdwn", "text": "✅ *등록 확인 완료*"}]}
+            if not blocks:
+                blocks = [{"type": "section", "text": {"type": "mrkdwn", "text": "알림 메시지"}}, confirmed]
+            else:
+                value = str(event_id)
+                blocks = [
+                    confirmed if b.get("type") == "actions" and any(
+                        el.get("action_id") == "confirm_registration" and el.get("value") == value
+                        for el in b.get("elements", [])
+                    ) else b
+                    for b in blocks
+                ]
             
-            # 2. Update UI: Remove the button so they can't click it again
-            # We pull the text from the first block if it exists
-            try:
-                blocks = body.get("message", {}).get("blocks", [])
-                original_text = blocks[0]["text"]["text"] if blocks else "알림 메시지"
-                
-                client.chat_update(
-                    channel=target_channel_id,
-                    ts=body["message"]["ts"],
-                    text="✅ 등록 확인 완료",
-                    blocks=[
-                        {"type": "section", "text": {"type": "mrkdwn", "text": original_text}},
-                        {"type": "context", "elements": [{"type": "mrkdwn", "text": "✅ *등록 확인 완료*"}]}
-                    ]
-                )
-            except Exception as e:
-                print(f"UI Update Error: {e}")
+            client.chat_update(
+                channel=target_channel_id,
+                ts=body["message"]["ts"],
+                text="✅ 등록 확인 완료",
+                blocks=blocks
+            )
+        except Exception as e:
+            logger.error("UI Update Error: %s", e)
 
-            # 3. SUCCESS FEED
-            config = AppConfig.query.get("consultant_channel")
-            
-            # Notify the channel where the button was clicked
+        # 3. SUCCESS FEED
+        consultant_channel = get_consultant_channel()
+        
+        # Notify the channel where the button was clicked
+        client.chat_postMessage(
+            channel=target_channel_id,
+            text=f"🎉 *{event_title}* 등록을 완료했습니다!"
+        )
+        
+        # Notify the Consultants
+        if consultant_channel:
             client.chat_postMessage(
-                channel=target_channel_id,
-                text=f"🎉 *{event.title}* 등록을 완료했습니다!"
+                channel=consultant_channel,
+                text=f"🎉 *등록 확인:* <#{target_channel_id}> 채널이 *{event_title}* 등록을 완료했습니다!"
             )
-            
-            # Notify the Consultants
-            if config:
-                client.chat_postMessage(
-                    channel=config.value,
-                    text=f"🎉 *등록 확인:* <#{target_channel_id}> 채널이 *{event.title}* 등록을 완료했습니다!"
-                )
-            
-            db.session.commit()
+        
+        db.session.commit()
 
 # --- Submissions (Create/Edit) ---
 @bolt_app.view("submit_new_event")
 def handle_event_sub(ack, body, view, client):
     ack()
     vals = view["state"]["values"]
-    with flask_app.app_context():
-        new_event = Event(
-            title=vals["title"]["i"]["value"],
-            event_type=vals["type"]["i"]["selected_option"]["value"],
-            event_date=datetime.strptime(vals["date"]["i"]["selected_date"], "%Y-%m-%d").date(),
-            registration_deadline=datetime.strptime(vals["deadline"]["i"]["selected_date"], "%Y-%m-%d").date()
-        )
-        db.session.add(new_event)
-        db.session.commit()
-        client.views_publish(user_id=body["user"]["id"], view={"type": "home", "blocks": get_dashboard_view(body["user"]["id"])})
+    new_event = Event(
+        title=vals["title"]["i"]["value"],
+        event_type=vals["type"]["i"]["selected_option"]["value"],
+        event_date=date.fromisoformat(vals["date"]["i"]["selected_date"]),
+        registration_deadline=date.fromisoformat(vals["deadline"]["i"]["selected_date"])
+    )
+    db.session.add(new_event)
+    db.session.commit()
+    invalidate_dashboard()
+    client.views_publish(user_id=body["user"]["id"], view={"type": "home", "blocks": get_dashboard_view(body["user"]["id"])})
 
 @bolt_app.view("submit_edit_event")
 def handle_edit_submission(ack, body, view, client):
@@ -1322,35 +1446,36 @@ def handle_edit_submission(ack, body, view, client):
     event_id = int(view["private_metadata"])
     vals = view["state"]["values"]
     
-    with flask_app.app_context():
-        event = Event.query.get(event_id)
-        if event:
-            event.title = vals["title"]["i"]["value"]
-            event.event_type = vals["type"]["i"]["selected_option"]["value"]
-            event.event_date = datetime.strptime(vals["date"]["i"]["selected_date"], "%Y-%m-%d").date()
-            event.registration_deadline = datetime.strptime(vals["deadline"]["i"]["selected_date"], "%Y-%m-%d").date()
-            db.session.commit()
-        client.views_publish(user_id=body["user"]["id"], view={"type": "home", "blocks": get_dashboard_view(body["user"]["id"])})
+    # UPDATE in place; no need to load the row first
+    updated = Event.query.filter_by(id=event_id).update({
+        "title": vals["title"]["i"]["value"],
+        "event_type": vals["type"]["i"]["selected_option"]["value"],
+        "event_date": date.fromisoformat(vals["date"]["i"]["selected_date"]),
+        "registration_deadline": date.fromisoformat(vals["deadline"]["i"]["selected_date"])
+    })
+    if updated:
+        db.session.commit()
+        invalidate_dashboard()
+    client.views_publish(user_id=body["user"]["id"], view={"type": "home", "blocks": get_dashboard_view(body["user"]["id"])})
 
 @bolt_app.view("submit_new_type")
 def handle_type_sub(ack, body, view, client):
     ack()
     name = view["state"]["values"]["name"]["i"]["value"]
-    with flask_app.app_context():
-        if not EventType.query.get(name):
-            db.session.add(EventType(name=name))
-            db.session.commit()
-        client.views_publish(user_id=body["user"]["id"], view={"type": "home", "blocks": get_dashboard_view(body["user"]["id"])})
+    insert_ignore(EventType, {"name": name})
+    db.session.commit()
+    invalidate_cache("types")
+    invalidate_dashboard()
+    client.views_publish(user_id=body["user"]["id"], view={"type": "home", "blocks": get_dashboard_view(body["user"]["id"])})
 
 @bolt_app.view("submit_new_admin")
 def handle_admin_sub(ack, body, view, client):
     ack()
     uid = view["state"]["values"]["user"]["i"]["selected_user"]
-    with flask_app.app_context():
-        if not AppAdmin.query.get(uid):
-            db.session.add(AppAdmin(user_slack_id=uid))
-            db.session.commit()
-        client.views_publish(user_id=body["user"]["id"], view={"type": "home", "blocks": get_dashboard_view(body["user"]["id"])})
+    insert_ignore(AppAdmin, {"user_slack_id": uid})
+    db.session.commit()
+    invalidate_cache("admins")
+    client.views_publish(user_id=body["user"]["id"], view={"type": "home", "blocks": get_dashboard_view(body["user"]["id"])})
 
 @bolt_app.view("submit_admin_sub")
 def handle_admin_sub_submission(ack, body, view, client):
@@ -1368,63 +1493,57 @@ def handle_admin_sub_submission(ack, body, view, client):
     target_msg = ""
     to_send_target = False
 
-    with flask_app.app_context():
-        
-        # --- MODE 1: SINGLE ITEM ---
-        if mode == "item":
-            selected_option = values["event_select"]["event_id"]["selected_option"]
-            if not selected_option or selected_option["value"] == "none":
-                # Send error message to Admin
-                client.chat_postMessage(channel=admin_id, text="⚠️ 이벤트를 선택해야 합니다.")
-                return
-
-            event_id = int(selected_option["value"])
-            event = Event.query.get(event_id)
-            
-            # Subscribe
-            if not Subscription.query.filter_by(channel_id=target_user, event_id=event_id).first():
-                db.session.add(Subscription(channel_id=target_user, event_id=event_id, status='Pending'))
-                msg = f"✅ <#{target_user}> 님을 *{event.title}*에 구독시켰습니다."
-                to_send_target = True
-                target_msg = f"✅ <#{target_user}> 님이 *{event.title}* 이벤트에 구독되었습니다."
-            else:
-                msg = f"ℹ️ <#{target_user}> 님은 이미 해당 이벤트에 구독 중입니다."
+    
+    # --- MODE 1: SINGLE ITEM ---
+    if mode == "item":
+        selected_option = values["event_select"]["event_id"]["selected_option"]
+        if not selected_option or selected_option["value"] == "none":
+            # Send error message to Admin
+            client.chat_postMessage(channel=admin_id, text="⚠️ 이벤트를 선택해야 합니다.")
+            return
 
-        # --- MODE 2: CATEGORY ---
-        elif mode == "cat":
-            selected_cat = values["cat_select"]["cat_name"]["selected_option"]
-            if not selected_cat:
-                client.chat_postMessage(channel=admin_id, text="⚠️ 카테고리를 선택해야 합니다.")
-                return
-            
-            cat_name = selected_cat["value"]
-            cat_events = Event.query.filter_by(event_type=cat_name).filter(Event.registration_deadline >= datetime.now().date()).all()
-            
-            count = 0
-            for event in cat_events:
-                if not Subscription.query.filter_by(channel_id=target_user, event_id=event.id).first():
-                    db.session.add(Subscription(channel_id=target_user, event_id=event.id, status='Pending'))
-                    count += 1
-            msg = f"✅ <#{target_user}> 님을 *{cat_name}* 카테고리 전체({count}개)에 구독시켰습니다."
+        event_id = int(selected_option["value"])
+        # Only the title is shown
+        event_title = db.session.query(Event.title).filter_by(id=event_id).scalar()
+        
+        # Subscribe; rowcount is 0 when the unique constraint skipped an existing subscription
+        if insert_ignore(Subscription, {"channel_id": target_user, "event_id": event_id, "status": 'Pending'}).rowcount:
+            msg = f"✅ <#{target_user}> 님을 *{event_title}*에 구독시켰습니다."
             to_send_target = True
-            event_names = [e.title for e in cat_events]
-            target_msg = f"✅ <#{target_user}> 님이 *{cat_name}* 카테고리의 다음 이벤트에 구독되었습니다:\n" + "\n".join([f"• {name}" for name in event_names])
+            target_msg = f"✅ <#{target_user}> 님이 *{event_title}* 이벤트에 구독되었습니다."
+        else:
+            msg = f"ℹ️ <#{target_user}> 님은 이미 해당 이벤트에 구독 중입니다."
 
-        # --- MODE 3: ALL ---
-        elif mode == "all":
-            all_events = Event.query.filter(Event.registration_deadline >= datetime.now().date()).all()
-            count = 0
-            for event in all_events:
-                if not Subscription.query.filter_by(channel_id=target_user, event_id=event.id).first():
-                    db.session.add(Subscription(channel_id=target_user, event_id=event.id, status='Pending'))
-                    count += 1
-            msg = f"✅ <#{target_user}> 님을 *모든 이벤트({count}개)*에 구독시켰습니다."
-            to_send_target = True
-            event_names = [e.title for e in all_events]
-            target_msg = f"✅ <#{target_user}> 님이 *모든 이벤트*에 구독되었습니다:\n" + "\n".join([f"• {name}" for name in event_names])
-        config = AppConfig.query.get("consultant_channel")
-        config_id = config.value if config else None
-        db.session.commit()
+    # --- MODE 2: CATEGORY ---
+    elif mode == "cat":
+        selected_cat = values["cat_select"]["cat_name"]["selected_option"]
+        if not selected_cat:
+            client.chat_postMessage(channel=admin_id, text="⚠️ 카테고리를 선택해야 합니다.")
+            return
+        
+        cat_name = selected_cat["value"]
+        cat_events = db.session.query(Event.id, Event.title).filter_by(event_type=cat_name).filter(Event.registration_deadline >= date.today()).all()
+        
+        # One INSERT for every event; the (channel_id, event_id) constraint skips ones already subscribed
+        rows = [{"channel_id": target_user, "event_id": event.id, "status": 'Pending'} for event in cat_events]
+        count = insert_ignore(Subscription, rows).rowcount if rows else 0
+        msg = f"✅ <#{target_user}> 님을 *{cat_name}* 카테고리 전체({count}개)에 구독시켰습니다."
+        to_send_target = True
+        event_names = [e.title for e in cat_events]
+        target_msg = f"✅ <#{target_user}> 님이 *{cat_name}* 카테고리의 다음 이벤트에 구독되었습니다:\n" + "\n".join([f"• {name}" for name in event_names])
+
+    # --- MODE 3: ALL ---
+    elif mode == "all":
+        all_events = db.session.query(Event.id, Event.title).filter(Event.registration_deadline >= date.today()).all()
+        # One INSERT for every event; the (channel_id, event_id) constraint skips ones already subscribed
+        rows = [{"channel_id": target_user, "event_id": event.id, "status": 'Pending'} for event in all_events]
+        count = insert_ignore(Subscription, rows).rowcount if rows else 0
+        msg = f"✅ <#{target_user}> 님을 *모든 이벤트({count}개)*에 구독시켰습니다."
+        to_send_target = True
+        event_names = [e.title for e in all_events]
+        target_msg = f"✅ <#{target_user}> 님이 *모든 이벤트*에 구독되었습니다:\n" + "\n".join([f"• {name}" for name in event_names])
+    config_id = get_consultant_channel()
+    db.session.commit()
     
     # Notify Admin of success
     client.chat_postEphemeral(channel=channel_id, user=admin_id, text=msg)
@@ -1433,8 +1552,6 @@ def handle_admin_sub_submission(ack, body, view, client):
             client.chat_postMessage(channel=config_id, text=target_msg)
         client.chat_postMessage(channel=target_user, text=target_msg)
 
-from datetime import datetime
-
 @bolt_app.view("submit_admin_register")
 def handle_admin_register_submission(ack, body, view, client):
     ack()
@@ -1456,73 +1573,64 @@ def handle_admin_register_submission(ack, body, view, client):
     to_send_target = False
     target_msg = ""
     try:
-        with flask_app.app_context():
-            msg = ""
+        msg = ""
+        
+        # --- MODE 1: SINGLE ITEM ---
+        if mode == "item":
+            # Matches your external_select action_id
+            block_data = values.get("event_select", {}).get("event_subscribed", {})
+            selected_option = block_data.get("selected_option")
             
-            # --- MODE 1: SINGLE ITEM ---
-            if mode == "item":
-                # Matches your external_select action_id
-                block_data = values.get("event_select", {}).get("event_subscribed", {})
-                selected_option = block_data.get("selected_option")
-                
-                if not selected_option or selected_option["value"] == "none":
-                    client.chat_postEphemeral(channel=context_channel, user=admin_id, text="⚠️ 이벤트를 선택해야 합니다.")
-                    return
+            if not selected_option or selected_option["value"] == "none":
+                client.chat_postEphemeral(channel=context_channel, user=admin_id, text="⚠️ 이벤트를 선택해야 합니다.")
+                return
 
-                event_id = int(selected_option["value"])
-                event = Event.query.get(event_id)
-                
-                # Check for existing subscription for this CHANNEL
-                sub = Subscription.query.filter_by(channel_id=target_id, event_id=event_id).first()
-                if sub:
-                    sub.status = 'Registered' # Upgrade Pending to Registered
-                else:
-                    db.session.add(Subscription(channel_id=target_id, event_id=event_id, status='Registered'))
-                
-                db.session.commit()
-                msg = f"✅ <#{target_id}> 채널이 *{event.title}*에 등록되었습니다."
-                target_msg = f"✅ <#{target_id}> 님이 *{event.title}* 이벤트에 등록되었습니다."
-                to_send_target = True
-
-            # --- MODE 2: CATEGORY ---
-            elif mode == "cat":
-                selected_cat = values["cat_select"]["cat_name"]["selected_option"]
-                if not selected_cat:
-                    client.chat_postEphemeral(channel=context_channel, user=admin_id, text="⚠️ 카테고리를 선택해야 합니다.")
-                    return
-                
-                cat_name = selected_cat["value"]
-                cat_events = Event.query.filter_by(event_type=cat_name).filter(Event.registration_deadline >= datetime.now().date()).all()
-                
-                count = 0
-                for event in cat_events:
-                    if not Subscription.query.filter_by(channel_id=target_id, event_id=event.id).first():
-                        db.session.add(Subscription(channel_id=target_id, event_id=event.id, status='Registered'))
-                        count += 1
-                
-                db.session.commit()
-                msg = f"✅ <#{target_id}> 채널이 *{cat_name}* 카테고리 전체({count}개)에 등록되었습니다."
-                event_names = [e.title for e in cat_events]
-                target_msg = f"✅ <#{target_id}> 님이 *{cat_name}* 카테고리의 다음 이벤트에 등록되었습니다:\n" + "\n".join([f"• {name}" for name in event_names])
-                to_send_target = True
-
-            # --- MODE 3: ALL ---
-            elif mode == "all":
-                all_events = Event.query.filter(Event.registration_deadline >= datetime.now().date()).all()
-                count = 0
-                for event in all_events:
-                    if not Subscription.query.filter_by(channel_id=target_id, event_id=event.id).first():
-                        db.session.add(Subscription(channel_id=target_id, event_id=event.id, status='Registered'))
-                        count += 1
-                
-                db.session.commit()
-                msg = f"✅ <#{target_id}> 채널이 *모든 이벤트({count}개)*에 등록되었습니다."
-                event_names = [e.title for e in all_events]
-                target_msg = f"✅ <#{target_id}> 님이 *모든 이벤트*에 등록되었습니다:\n" + "\n".join([f"• {name}" for name in event_names])
-                to_send_target = True
-            config = AppConfig.query.get("consultant_channel")
-            config_id = config.value if config else None
-            targ = target_id
+            event_id = int(selected_option["value"])
+            # Only the title is shown
+            event_title = db.session.query(Event.title).filter_by(id=event_id).scalar()
+            
+            # Upgrade an existing Pending subscription for this CHANNEL, otherwise create it
+            if not Subscription.query.filter_by(channel_id=target_id, event_id=event_id).update({"status": 'Registered'}):
+                db.session.add(Subscription(channel_id=target_id, event_id=event_id, status='Registered'))
+            
+            msg = f"✅ <#{target_id}> 채널이 *{event_title}*에 등록되었습니다."
+            target_msg = f"✅ <#{target_id}> 님이 *{event_title}* 이벤트에 등록되었습니다."
+            to_send_target = True
+
+        # --- MODE 2: CATEGORY ---
+        elif mode == "cat":
+            selected_cat = values["cat_select"]["cat_name"]["selected_option"]
+            if not selected_cat:
+                client.chat_postEphemeral(channel=context_channel, user=admin_id, text="⚠️ 카테고리를 선택해야 합니다.")
+                return
+            
+            cat_name = selected_cat["value"]
+            cat_events = db.session.query(Event.id, Event.title).filter_by(event_type=cat_name).filter(Event.registration_deadline >= date.today()).all()
+            
+            # One INSERT for every event; the (channel_id, event_id) constraint skips ones already subscribed
+            rows = [{"channel_id": target_id, "event_id": event.id, "status": 'Registered'} for event in cat_events]
+            count = insert_ignore(Subscription, rows).rowcount if rows else 0
+            
+            msg = f"✅ <#{target_id}> 채널이 *{cat_name}* 카테고리 전체({count}개)에 등록되었습니다."
+            event_names = [e.title for e in cat_events]
+            target_msg = f"✅ <#{target_id}> 님이 *{cat_name}* 카테고리의 다음 이벤트에 등록되었습니다:\n" + "\n".join([f"• {name}" for name in event_names])
+            to_send_target = True
+
+        # --- MODE 3: ALL ---
+        elif mode == "all":
+            all_events = db.session.query(Event.id, Event.title).filter(Event.registration_deadline >= date.today()).all()
+            # One INSERT for every event; the (channel_id, event_id) constraint skips ones already subscribed
+            rows = [{"channel_id": target_id, "event_id": event.id, "status": 'Registered'} for event in all_events]
+            count = insert_ignore(Subscription, rows).rowcount if rows else 0
+            
+            msg = f"✅ <#{target_id}> 채널이 *모든 이벤트({count}개)*에 등록되었습니다."
+            event_names = [e.title for e in all_events]
+            target_msg = f"✅ <#{target_id}> 님이 *모든 이벤트*에 등록되었습니다:\n" + "\n".join([f"• {name}" for name in event_names])
+            to_send_target = True
+        config_id = get_consultant_channel()
+        # One commit for whichever mode ran
+        db.session.commit()
+        targ = target_id
 
         # 2. Notify the Admin (Ephemeral in the original channel)
         client.chat_postEphemeral(channel=context_channel, user=admin_id, text=msg)
@@ -1534,28 +1642,50 @@ def handle_admin_register_submission(ack, body, view, client):
             client.chat_postMessage(channel=channel_to_notify, text=target_msg)
 
     except Exception as e:
-        print(f"CRITICAL ERROR in submission: {e}")
+        logger.error("CRITICAL ERROR in submission: %s", e)
         client.chat_postMessage(channel=admin_id, text=f"❌ DB 등록 오류: {str(e)}")
 
 # --- Interactive Actions ---
 
+# Shared by the subscribe toggle and the admin overflow menu
+def set_subscription(channel_id, event_id, action):
+    """
+    Subscribes ("sub") or unsubscribes ("unsub") a channel in one statement and commits.
+    Returns how many rows changed: 0 when it was already in that state.
+    """
+    if action == "sub":
+        changed = insert_ignore(Subscription, {"channel_id": channel_id, "event_id": event_id, "status": "Pending"}).rowcount
+    else:
+        changed = Subscription.query.filter_by(channel_id=channel_id, event_id=event_id).delete(synchronize_session=False)
+    db.session.commit()
+    return changed
+
 # 1. Standard User Subscribe Toggle
 @bolt_app.action("toggle_subscription")
 def handle_toggle(ack, body, client):
     ack()
     user_id = body["user"]["id"]
     event_id, action = body["actions"][0]["value"].split("|")
-    event_id = int(event_id)
+    changed = set_subscription(user_id, int(event_id), action)
     
-    with flask_app.app_context():
-        if action == "sub":
-            if not Subscription.query.filter_by(channel_id=user_id, event_id=event_id).first():
-                db.session.add(Subscription(channel_id=user_id, event_id=event_id, status='Pending'))
-        else:
-            Subscription.query.filter_by(channel_id=user_id, event_id=event_id).delete()
-        db.session.commit()
-        
-        # Refresh View
+    # No row changed (a double-click, or a stale button for a state already in the DB): skip the refresh.
+    # For a double-click the first click already refreshed the view; a stale view stays stale until the next refresh.
+    if not changed:
+        return
+    
+    # Refresh only the view the click came from, in place (hash guards against stale overwrites)
+    view = body.get("view")
+    if view:
+        context = view.get("private_metadata", "")
+        home_view = {"type": "home", "private_metadata": context, "blocks": render_home_context(user_id, context)}
+        try:
+            client.views_update(view_id=view["id"], hash=view["hash"], view=home_view)
+        except SlackApiError as e:
+            # The tab changed after this click was rendered (e.g. a quick second click); publish the fresh view instead
+            if e.response.get("error") != "hash_conflict":
+                raise
+            client.views_publish(user_id=user_id, view=home_view)
+    else:
         client.views_publish(user_id=user_id, view={"type": "home", "blocks": get_dashboard_view(user_id)})
 
 # 2. Admin Overflow Logic (Edit / Delete / Subscribe)
@@ -1571,76 +1701,69 @@ def handle_event_overflow(ack, body, client):
         open_edit_event_modal(client, body["trigger_id"], event_id)
         
     elif action == "delete":
-        with flask_app.app_context():
-            Subscription.query.filter_by(event_id=event_id).delete()
-            Event.query.filter_by(id=event_id).delete()
-            db.session.commit()
-            client.views_publish(user_id=user_id, view={"type": "home", "blocks": get_dashboard_view(user_id)})
-            
+        # New schemas cascade via the FK; the explicit delete covers tables created before
+        # ondelete='CASCADE' existed and SQLite (FKs not enforced by default). Same transaction either way.
+        Subscription.query.filter_by(event_id=event_id).delete(synchronize_session=False)
+        Event.query.filter_by(id=event_id).delete(synchronize_session=False)
+        db.session.commit()
+        invalidate_dashboard()
+        client.views_publish(user_id=user_id, view={"type": "home", "blocks": get_dashboard_view(user_id)})
+        
     elif action in ["sub", "unsub"]:
-        with flask_app.app_context():
-            if action == "sub":
-                if not Subscription.query.filter_by(channel_id=user_id, event_id=event_id).first():
-                    db.session.add(Subscription(channel_id=user_id, event_id=event_id, status='Pending'))
-            else:
-                Subscription.query.filter_by(user_slack_id=user_id, event_id=event_id).delete()
-            db.session.commit()
+        if set_subscription(user_id, event_id, action):
             client.views_publish(user_id=user_id, view={"type": "home", "blocks": get_dashboard_view(user_id)})
 
+# Slack caps option text at 75 characters
+OPTION_TEXT_MAX = 75
+# len(" (YYYY-MM-DD)")
+_DATED_LABEL_OVERHEAD = 13
+
+def _truncate(text, limit):
+    """Returns text, cut to at most `limit` characters with a trailing '...' when it is longer."""
+    return text if len(text) <= limit else text[:max(0, limit - 3)] + "..."
+
 @bolt_app.options("event_search")
 def handle_event_search(ack, body):
     """Dynamically load events based on user search query."""
-    search_value = body.get("value", "").lower()
+    search_value = body.get("value", "").strip().lower()
+    if len(search_value) < MIN_SEARCH_LEN:
+        return ack(options=[])
     
-    with flask_app.app_context():
-        # Search events by title
-        events = Event.query.filter(
-            Event.title.ilike(f"%{search_value}%"),
-            Event.registration_deadline >= datetime.now().date()
-        ).limit(100).all()
-        
-        options = []
-        for e in events:
-            date_str = e.event_date.strftime('%Y-%m-%d')
-            safe_title = e.title
-            safe_cat = e.event_type
-            occupied_len = len(safe_cat) + len(date_str) + 5
-            
-            if len(safe_title) > 75 - occupied_len:
-                safe_title = safe_title[:max(0, 75 - occupied_len - 3)] + "..."
-            
-            label_text = f"{safe_cat} - {safe_title} ({date_str})"
-            options.append({
-                "text": {"type": "plain_text", "text": label_text},
-                "value": str(e.id)
-            })
+    # Search events by title
+    events = db.session.query(Event.id, Event.title, Event.event_type, Event.event_date).filter(
+        Event.title.ilike(f"%{search_value}%"),
+        Event.registration_deadline >= date.today()
+    ).order_by(Event.registration_deadline).limit(100).all()
+    
+    # Label is "<cat> - <title> (YYYY-MM-DD)"; the title gets what's left of the 75-char limit
+    options = []
+    for e in events:
+        title = _truncate(e.title, OPTION_TEXT_MAX - len(e.event_type) - len(" - ") - _DATED_LABEL_OVERHEAD)
+        options.append({
+            "text": {"type": "plain_text", "text": f"{e.event_type} - {title} ({e.event_date.isoformat()})"},
+            "value": str(e.id)
+        })
     ack(options=options)
 
 @bolt_app.options("event_id")
 def handle_admin_event_search(ack, body):
     """Dynamically load events for admin subscription modal."""
-    search_value = body.get("value", "").lower()
-
-    with flask_app.app_context():
-        events = Event.query.filter(
-            Event.title.ilike(f"%{search_value}%"),
-            Event.registration_deadline >= datetime.now().date()
-        ).limit(100).all()
-        options = []
-        for e in events:
-            date_str = e.event_date.strftime('%Y-%m-%d')
-            safe_title = e.title
-            safe_cat = e.event_type
-            occupied_len = len(date_str) + 5
-            
-            if len(safe_title) > 75 - occupied_len:
-                safe_title = safe_title[:max(0, 75 - occupied_len - 3)] + "..."
-            
-            label_text = f"{safe_title} ({date_str})"
-            options.append({
-                "text": {"type": "plain_text", "text": label_text},
-                "value": str(e.id)
-            })
+    search_value = body.get("value", "").strip().lower()
+    if len(search_value) < MIN_SEARCH_LEN:
+        return ack(options=[])
+
+    events = db.session.query(Event.id, Event.title, Event.event_type, Event.event_date).filter(
+        Event.title.ilike(f"%{search_value}%"),
+        Event.registration_deadline >= date.today()
+    ).order_by(Event.registration_deadline).limit(100).all()
+    # Label is "<title> (YYYY-MM-DD)"; same budget for every row
+    max_title = OPTION_TEXT_MAX - _DATED_LABEL_OVERHEAD
+    options = []
+    for e in events:
+        options.append({
+            "text": {"type": "plain_text", "text": f"{_truncate(e.title, max_title)} ({e.event_date.isoformat()})"},
+            "value": str(e.id)
+        })
     ack(options=options)
 
 
@@ -1648,8 +1771,8 @@ import json
 
 @bolt_app.options("event_subscribed")
 def handle_admin_event_subscribed_search(ack, body):
-    # DEBUG: Full body print as requested
-    print(f"DEBUG: Full Options Body: {json.dumps(body, indent=2)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Full Options Body: %s", json.dumps(body, indent=2))
     
     view = body.get("view", {})
     state_values = view.get("state", {}).get("values", {})
@@ -1674,27 +1797,27 @@ def handle_admin_event_subscribed_search(ack, body):
         return ack(options=[{"text": {"type": "plain_text", "text": "⚠️ 채널을 먼저 선택하세요"}, "value": "none"}])
 
     try:
-        with flask_app.app_context():
-            results = db.session.query(Subscription, Event)\
-                .join(Event, Subscription.event_id == Event.id)\
-                .filter(Subscription.channel_id == channel_id, Subscription.status == 'Pending')\
-                .all()
-
-            options = []
-            for sub, event in results:
-                date_str = event.event_date.strftime('%Y-%m-%d')
-                title = (event.title[:50] + '..') if len(event.title) > 50 else event.title
-                options.append({
-                    "text": {"type": "plain_text", "text": f"{title} ({date_str})"},
-                    "value": str(event.id)
-                })
+        # Only the columns the option label needs; no Subscription/Event instances
+        results = db.session.query(Event.id, Event.title, Event.event_date)\
+            .join(Subscription, Subscription.event_id == Event.id)\
+            .filter(Subscription.channel_id == channel_id, Subscription.status == 'Pending')\
+            .all()
 
-            if not options:
-                return ack(options=[{"text": {"type": "plain_text", "text": "신청건 없음"}, "value": "none"}])
-            
-            ack(options=options)
+        options = []
+        for event in results:
+            date_str = event.event_date.isoformat()
+            title = (event.title[:50] + '..') if len(event.title) > 50 else event.title
+            options.append({
+                "text": {"type": "plain_text", "text": f"{title} ({date_str})"},
+                "value": str(event.id)
+            })
+
+        if not options:
+            return ack(options=[{"text": {"type": "plain_text", "text": "신청건 없음"}, "value": "none"}])
+        
+        ack(options=options)
     except Exception as e:
-        print(f"DB Error: {e}")
+        logger.error("DB Error: %s", e)
         ack(options=[])
 
 # -------------------------
@@ -1712,6 +1835,15 @@ def slack_actions():
 def keep_alive():
     return {"status": "alive"}, 200
 
+# Reminder lead times, indexed by days left (today .. 3 days out)
+_DAYS_LEFT_LABELS = ("오늘", "내일", "2일 후", "3일 후")
+# Reminders for one channel are combined into a single DM; each takes 2 blocks and Slack allows 50 per message
+REMINDERS_PER_MESSAGE = 25
+_REMINDER_REGISTERED_BLOCK = {
+    "type": "context",
+    "elements": [{"type": "mrkdwn", "text": "✅ Status: Registered"}]
+}
+
 # Secure Cron Trigger
 @flask_app.route("/api/run-reminders", methods=["POST"])
 def trigger_reminders():
@@ -1729,82 +1861,104 @@ def trigger_reminders():
         return {"error": "Unauthorized"}, 401
 
     try:
-        today = datetime.now().date()
-        total_sent = 0
+        today = date.today()
+        dates = [today + timedelta(days=d) for d in range(len(_DAYS_LEFT_LABELS))]
+
+        # One query for every event due in the window, one for all of their subscribers
+        events = Event.query.filter(
+            db.or_(Event.registration_deadline.in_(dates), Event.event_date.in_(dates))
+        ).order_by(Event.id).all()
+        subs_by_event = {}
+        if events:
+            # Plain rows, fetched 500 at a time (server-side cursor on PostgreSQL) instead of all at once
+            sub_rows = db.session.query(Subscription.event_id, Subscription.channel_id, Subscription.status).filter(
+                Subscription.event_id.in_([e.id for e in events])
+            ).yield_per(500)
+            for sub in sub_rows:
+                subs_by_event.setdefault(sub.event_id, []).append(sub)
+
+        reminders_by_channel = {}
 
         def notify(evt, msg):
-            cnt = 0
             # 🆕 Only notify if they haven't registered yet? 
             # Or notify everyone and let them confirm? 
             # Decision: Notify everyone, but only show button if status is Pending.
-            for sub in Subscription.query.filter_by(event_id=evt.id).all():
-                try:
-                    blocks = [
-                        {"type": "section", "text": {"type": "mrkdwn", "text": msg}}
-                    ]
-                    
-                    # 🆕 ADD CONFIRM BUTTON if Pending
-                    if sub.status == "Pending":
-                        blocks.append({
-                            "type": "actions",
-                            "elements": [{
-                                "type": "button",
-                                "text": {"type": "plain_text", "text": "✅ I Registered (등록 완료)"},
-                                "style": "primary",
-                                "value": str(evt.id),
-                                "action_id": "confirm_registration"
-                            }]
-                        })
-                    else:
-                        blocks.append({
-                            "type": "context",
-                            "elements": [{"type": "mrkdwn", "text": "✅ Status: Registered"}]
-                        })
-
-                    bolt_app.client.chat_postMessage(channel=sub.user_slack_id, text=msg, blocks=blocks)
-                    cnt += 1
-                except Exception as e: logger.error(f"Fail DM {sub.user_slack_id}: {e}")
-            return cnt
-
-        for days_left in [0, 1, 2, 3]:
-            target_date = today + timedelta(days=days_left)
-            time_str = "오늘" if days_left == 0 else "내일" if days_left == 1 else f"{days_left}일 후"
+            # The two possible block lists are the same for every subscriber of this event
+            section = {"type": "section", "text": {"type": "mrkdwn", "text": msg}}
+            # 🆕 ADD CONFIRM BUTTON if Pending
+            pending_blocks = [section, {
+                "type": "actions",
+                "elements": [{
+                    "type": "button",
+                    "text": {"type": "plain_text", "text": "✅ I Registered (등록 완료)"},
+                    "style": "primary",
+                    "value": str(evt.id),
+                    "action_id": "confirm_registration"
+                }]
+            }]
+            registered_blocks = [section, _REMINDER_REGISTERED_BLOCK]
+            for sub in subs_by_event.get(evt.id, []):
+                blocks = pending_blocks if sub.status == "Pending" else registered_blocks
+                reminders_by_channel.setdefault(sub.channel_id, []).append((msg, blocks))
+
+        for target_date, time_str in zip(dates, _DAYS_LEFT_LABELS):
 
             # 1. Registration Deadlines
-            deadline_events = Event.query.filter_by(registration_deadline=target_date).all()
-            for event in deadline_events:
-                msg = f"⚠️ *{event.event_type}* *{event.title}* 가입 데드라인이 *{time_str}* 닫힙니다 ({event.registration_deadline})!"
-                total_sent += notify(event, msg)
+            for event in events:
+                if event.registration_deadline == target_date:
+                    msg = f"⚠️ *{event.event_type}* *{event.title}* 가입 데드라인이 *{time_str}* 닫힙니다 ({event.registration_deadline})!"
+                    notify(event, msg)
 
             # 2. Event Dates
-            test_day_events = Event.query.filter_by(event_date=target_date).all()
-            for event in test_day_events:
-                msg = f"📅 *이벤트 알림:* *{event.event_type}* *{event.title}*이 *{time_str}* 입니다 ({event.event_date})!"
-                total_sent += notify(event, msg)
+            for event in events:
+                if event.event_date == target_date:
+                    msg = f"📅 *이벤트 알림:* *{event.event_type}* *{event.title}*이 *{time_str}* 입니다 ({event.event_date})!"
+                    notify(event, msg)
+
+        # One DM per channel instead of one per reminder: Slack rate-limits posts to the same channel to ~1/sec
+        messages = []
+        for channel_id, reminders in reminders_by_channel.items():
+            for i in range(0, len(reminders), REMINDERS_PER_MESSAGE):
+                batch = reminders[i:i + REMINDERS_PER_MESSAGE]
+                messages.append({
+                    "channel": channel_id,
+                    "text": "\n".join(msg for msg, _ in batch),
+                    "blocks": [block for _, blocks in batch for block in blocks],
+                    # Reminders carry no links worth previewing; skipping unfurls saves Slack a fetch per DM
+                    "unfurl_links": False,
+                    "unfurl_media": False
+                })
+
+        dms_sent = post_messages(bolt_app.client, messages)
 
     # 2. Run Consultant Briefing
         try:
-            config = AppConfig.query.get("consultant_channel")
-            if config:
+            consultant_channel = get_consultant_channel()
+            if consultant_channel:
                 # Generate the fancy blocks
                 briefing_blocks = generate_morning_briefing(today)
                 
                 # Post to the consultant channel
                 bolt_app.client.chat_postMessage(
-                    channel=config.value,
+                    channel=consultant_channel,
                     text="Morning Briefing", # Fallback text
-                    blocks=briefing_blocks
+                    blocks=briefing_blocks,
+                    unfurl_links=False,
+                    unfurl_media=False
                 )
-                print("Briefing sent successfully.")
+                logger.info("Briefing sent successfully.")
         except Exception as e:
-            logger.error(f"Failed to send briefing: {e}")
+            logger.error("Failed to send briefing: %s", e)
 
-        return {"status": "success", "reminders_sent": total_sent}, 200
+        return {"status": "success", "dms_sent": dms_sent}, 200
 
     except Exception as e:
-        logger.error(f"Cron failed: {e}")
+        logger.error("Cron failed: %s", e)
         return {"error": str(e)}, 500
 
+# Pending channels named per Red Zone event; the rest are summarised as a count
+BRIEFING_NAME_LIMIT = 20
+
 def generate_morning_briefing(today):
     """
     Generates a Block Kit message for the daily Consultant Briefing in Korean.
@@ -1824,44 +1978,62 @@ def generate_morning_briefing(today):
     # Look for deadlines Today (0) and Tomorrow (1)
     urgent_found = False
     
-    for d in [0, 1]:
-        target_date = today + timedelta(days=d)
-        time_str = "오늘" if d == 0 else "내일"
-        
-        # Find events with deadlines on this day
-        deadlines = Event.query.filter_by(registration_deadline=target_date).all()
+    # Both days' deadlines in one query, and the first few pending channels of each in a second
+    deadlines = Event.query.filter(
+        Event.registration_deadline.in_([today, today + timedelta(days=1)])
+    ).order_by(Event.registration_deadline, Event.id).all()
+    pending_by_event = {}
+    if deadlines:
+        ranked = db.session.query(
+            Subscription.event_id,
+            Subscription.channel_id,
+            db.func.row_number().over(partition_by=Subscription.event_id, order_by=Subscription.id).label("rn"),
+            db.func.count().over(partition_by=Subscription.event_id).label("pending_total")
+        ).filter(
+            Subscription.event_id.in_([e.id for e in deadlines]),
+            Subscription.status == "Pending"
+        ).subquery()
+        pending_rows = db.session.query(ranked).filter(
+            ranked.c.rn <= BRIEFING_NAME_LIMIT
+        ).order_by(ranked.c.event_id, ranked.c.rn)
+        for row in pending_rows:
+            pending_by_event.setdefault(row.event_id, []).append(row)
+    
+    for e in deadlines:
+        time_str = "오늘" if e.registration_deadline == today else "내일"
+        # Who hasn't registered yet
+        pending_subs = pending_by_event.get(e.id, [])
         
-        for e in deadlines:
-            # Find who hasn't registered yet
-            pending_subs = Subscription.query.filter_by(event_id=e.id, status="Pending").all()
+        if pending_subs:
+            urgent_found = True
+            pending_total = pending_subs[0].pending_total
+            names = [f"<#{s.channel_id}>" for s in pending_subs]
+            student_list = ", ".join(names)
+            if pending_total > len(names):
+                student_list += f" … 외 {pending_total - len(names)}명"
             
-            if pending_subs:
-                urgent_found = True
-                names = [f"<#{s.channel_id}>" for s in pending_subs]
-                student_list = ", ".join(names)
-                
-                blocks.append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn", 
-                        "text": f"🚨 *긴급 점검: {e.title}*\n등록 마감이 *{time_str}* 입니다!"
-                    }
-                })
-                blocks.append({
-                    "type": "context",
-                    "elements": [{"type": "mrkdwn", "text": f"⚠️ *미등록 학생 {len(pending_subs)}명:* {student_list}"}]
-                })
-                # Actionable Tip
-                blocks.append({
-                    "type": "context",
-                    "elements": [{"type": "mrkdwn", "text": f"👉 *조치:* `/nudge-pending {e.id}` 명령어로 독촉 알림 보내기"}]
-                })
-            else:
-                # If everyone registered, show a mini success message
-                blocks.append({
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": f"✅ *{e.title}* (마감 {time_str}): 구독한 모든 학생이 등록을 완료했습니다."}
-                })
+            blocks.append({
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn", 
+                    "text": f"🚨 *긴급 점검: {e.title}*\n등록 마감이 *{time_str}* 입니다!"
+                }
+            })
+            blocks.append({
+                "type": "context",
+                "elements": [{"type": "mrkdwn", "text": f"⚠️ *미등록 학생 {pending_total}명:* {student_list}"}]
+            })
+            # Actionable Tip
+            blocks.append({
+                "type": "context",
+                "elements": [{"type": "mrkdwn", "text": f"👉 *조치:* `/nudge-pending {e.id}` 명령어로 독촉 알림 보내기"}]
+            })
+        else:
+            # If everyone registered, show a mini success message
+            blocks.append({
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": f"✅ *{e.title}* (마감 {time_str}): 구독한 모든 학생이 등록을 완료했습니다."}
+            })
 
     if not urgent_found:
         blocks.append({
@@ -1881,22 +2053,32 @@ def generate_morning_briefing(today):
     upcoming_events = Event.query.filter(Event.event_date > today, Event.event_date <= end_date).order_by(Event.event_date).all()
     
     if upcoming_events:
-        text_lines = ""
+        # Total and pending per event from one GROUP BY instead of two COUNTs per event
+        counts = {
+            row.event_id: (row.total, row.pending)
+            for row in db.session.query(
+                Subscription.event_id,
+                db.func.count().label("total"),
+                db.func.count(db.case((Subscription.status == "Pending", 1))).label("pending")
+            ).filter(
+                Subscription.event_id.in_([e.id for e in upcoming_events])
+            ).group_by(Subscription.event_id)
+        }
+        text_lines = []
         for e in upcoming_events:
             # Calculate status summary
-            total = Subscription.query.filter_by(event_id=e.id).count()
-            pending = Subscription.query.filter_by(event_id=e.id, status="Pending").count()
+            total, pending = counts.get(e.id, (0, 0))
             registered = total - pending
             
             # Status Logic: Green if all registered, Yellow if <3 pending, Red otherwise
             status_icon = "🟢" if pending == 0 else "🟡" if pending < 3 else "🔴"
             date_pretty = e.event_date.strftime('%m/%d')
             
-            text_lines += f"{status_icon} *{date_pretty}:* {e.title} ({total}명 중 {registered}명 완료)\n"
+            text_lines.append(f"{status_icon} *{date_pretty}:* {e.title} ({total}명 중 {registered}명 완료)\n")
         
         blocks.append({
             "type": "section",
-            "text": {"type": "mrkdwn", "text": text_lines}
+            "text": {"type": "mrkdwn", "text": "".join(text_lines)}
         })
     else:
          blocks.append({"type": "context", "elements": [{"type": "mrkdwn", "text": "이번 주 예정된 이벤트가 없습니다."}]})
@@ -1,8 +1,9 @@
 import os
 import csv
 import io
-from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, String, Date, ForeignKey, UniqueConstraint
+from datetime import date
+from sqlalchemy import create_engine, insert, Column, Integer, String, Date, ForeignKey, UniqueConstraint
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import declarative_base, sessionmaker, relationship
 
 # -------------------------
@@ -129,7 +130,38 @@ Physics C Electricity and Magnetism,Late,Hybrid Digital,"KAEC, Seoul",2026-05-22
 """
 
 # -------------------------
-# 4. Initialization Logic
+# 4. Parsed Rows
+#    (built once at import; main() only inserts them)
+# -------------------------
+REGISTRATION_DEADLINE = date(2026, 3, 10)
+
+def _parse_events():
+    events = []
+    for row in csv.DictReader(io.StringIO(CSV_DATA)):
+        # Construct Title
+        status_indicator = ""
+        if row['Status'] == 'Full':
+            status_indicator = " (FULL)"
+        elif row['Status'] == 'Limited seats':
+            status_indicator = " (Low Seats)"
+
+        formatted_title = f"{row['Exam Name']} [{row['Window']}, {row['Location']}]{status_indicator}"
+
+        try:
+            events.append({
+                "title": formatted_title,
+                "event_type": "AP", # Assuming everything in this CSV is an AP exam
+                "event_date": date.fromisoformat(row['Date']),
+                "registration_deadline": REGISTRATION_DEADLINE
+            })
+        except ValueError as e:
+            print(f"Skipping row due to date error: {row['Exam Name']} - {e}")
+    return tuple(events)
+
+EVENTS_2026 = _parse_events()
+
+# -------------------------
+# 5. Initialization Logic
 # -------------------------
 def main():
     print(f"Connecting to database: {DATABASE_URL}")
@@ -143,49 +175,24 @@ def main():
 
     # B. Seed Categories
     # We add standard categories like AP, SAT, ACT so the app isn't empty
+    # One INSERT; categories that already exist are skipped by ON CONFLICT DO NOTHING
     default_types = ["AP", "SAT", "ACT", "GCSE", "Extracurricular"]
-    for t_name in default_types:
-        if not session.query(EventType).filter_by(name=t_name).first():
-            print(f"Adding Category: {t_name}")
-            session.add(EventType(name=t_name))
-    session.commit()
+    dialect = postgresql if engine.dialect.name == "postgresql" else sqlite
+    added = session.execute(
+        dialect.insert(EventType).values([{"name": t_name} for t_name in default_types]).on_conflict_do_nothing()
+    ).rowcount
+    print(f"Added {added} new categories.")
 
     # C. Seed Events from CSV
-    print("Parsing and inserting event data...")
-    deadline = datetime.strptime("2026-03-10", "%Y-%m-%d").date()
-
-    reader = csv.DictReader(io.StringIO(CSV_DATA))
-    events_to_add = []
-
-    for row in reader:
-        # Construct Title
-        status_indicator = ""
-        if row['Status'] == 'Full':
-            status_indicator = " (FULL)"
-        elif row['Status'] == 'Limited seats':
-            status_indicator = " (Low Seats)"
-
-        formatted_title = f"{row['Exam Name']} [{row['Window']}, {row['Location']}]{status_indicator}"
-        
-        try:
-            event_date_obj = datetime.strptime(row['Date'], "%Y-%m-%d").date()
-            
-            new_event = Event(
-                title=formatted_title,
-                event_type="AP", # Assuming everything in this CSV is an AP exam
-                event_date=event_date_obj,
-                registration_deadline=deadline
-            )
-            events_to_add.append(new_event)
-        except ValueError as e:
-            print(f"Skipping row due to date error: {row['Exam Name']} - {e}")
-
-    if events_to_add:
-        session.add_all(events_to_add)
-        session.commit()
-        print(f"Successfully inserted {len(events_to_add)} events.")
+    print("Inserting event data...")
+    # Plain dicts for a single executemany INSERT instead of ORM objects flushed one by one
+    if EVENTS_2026:
+        session.execute(insert(Event), EVENTS_2026)
+        print(f"Successfully inserted {len(EVENTS_2026)} events.")
     else:
         print("No valid events found in CSV data.")
+    # Categories and events are committed together
+    session.commit()
 
     session.close()
     print("Database initialization complete.")